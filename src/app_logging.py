@@ -0,0 +1,92 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+
+# Configuration Constants - logging settings
+LOG_LEVEL = logging.INFO        # Isse neeche ke messages drop (DEBUG bhi chahiye to DEBUG karo)
+LOG_FORMAT = "%(message)s"      # Console pe pehle jaisa hi dikhe - sirf message
+LOG_RATE_LIMIT_SECONDS = 1.0    # Per-frame message template itni der me max ek baar
+ROOT_LOGGER = "kaunhaibe"
+
+# Har frame pe aane wale messages (gaze per face, capture fail...) isse log karo:
+# log.info(..., extra=PER_FRAME). Baaki sab (start/stop, errors, state change) kabhi nahi dabte
+PER_FRAME = {"rate_limit": True}
+
+_setup_lock = threading.Lock()
+_listener = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Opt-in rate limit - sirf woh records jinke saath extra=PER_FRAME (ya rate_limit=seconds) ho
+    Key = logger + message template (args nahi), isliye "Face #%s ..." har face/frame pe alag
+    message nahi ginta. Lifecycle/error messages ko yeh kabhi nahi chhoota (3 cameras ke
+    teen "start" teeno dikhenge)
+    Jo drop hue unki ginti agle emit hue record me "(+N dabe)" ban ke jaati hai
+    """
+    def __init__(self, interval=LOG_RATE_LIMIT_SECONDS):
+        super().__init__()
+        self.interval = interval
+        self._last = {}        # key -> last emit time
+        self._suppressed = {}  # key -> kitne drop hue
+        self.dropped = 0       # Total drop count
+
+    def filter(self, record):
+        interval = getattr(record, "rate_limit", False)
+        if interval is True:
+            interval = self.interval
+        if not interval or interval <= 0:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        last = self._last.get(key)
+        if last is not None and now - last < interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            self.dropped += 1
+            return False
+        self._last[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} dabe)"
+        return True
+
+
+def setup_logging(level=LOG_LEVEL, rate_limit=LOG_RATE_LIMIT_SECONDS, stream=None):
+    """
+    App ka logging ek baar set karo - hot path sirf queue me daalta hai,
+    asli stdout write QueueListener ke background thread me hota hai
+    """
+    global _listener
+    with _setup_lock:
+        root = logging.getLogger(ROOT_LOGGER)
+        if _listener is not None:
+            return root
+
+        records = queue.SimpleQueue()
+        console = logging.StreamHandler(stream or sys.stdout)
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        _listener = logging.handlers.QueueListener(records, console)
+        _listener.start()
+        atexit.register(_listener.stop)  # Exit pe bache hue messages flush
+
+        root.setLevel(level)
+        root.addHandler(logging.handlers.QueueHandler(records))
+        root.propagate = False
+        root.rate_limiter = RateLimitFilter(rate_limit)
+        return root
+
+
+def get_logger(name):
+    """
+    Module ka logger - rate limit filter ke saath (logger pe, taaki drop hue records
+    queue tak bhi na pahunchen). Messages me %-style args do, f-string nahi
+    """
+    root = setup_logging()
+    logger = logging.getLogger(f"{ROOT_LOGGER}.{name}")
+    if root.rate_limiter not in logger.filters:
+        logger.addFilter(root.rate_limiter)
+    return logger
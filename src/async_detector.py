@@ -0,0 +1,228 @@
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+from app_logging import get_logger
+from backends import MAX_FACES, MODEL_DIR, NUM_LANDMARKS
+from detector import FaceDetector, INFERENCE_WIDTH, TRACKING_ENABLED
+
+log = get_logger("async_detector")
+
+# Configuration Constants - MediaPipe Tasks FaceLandmarker (LIVE_STREAM)
+FACE_LANDMARKER_MODEL = "face_landmarker.task"  # MODEL_DIR me (MediaPipe ka model bundle)
+ASYNC_OUTPUT_BLENDSHAPES = True  # 52 blendshape scores bhi nikalo (expressions, blink...)
+HEAD_POSE_CHECK = True           # Transform matrix se mude hue sir ka iris check skip
+HEAD_YAW_LIMIT = 35.0            # Itne degree se zyada daaye/baaye muda sir = screen nahi dekh raha
+HEAD_PITCH_LIMIT = 30.0          # Itne degree se zyada upar/neeche = screen nahi dekh raha
+ASYNC_STALE_SECONDS = 0.5        # In-flight frame ka result itni der me na aaye to busy mat maano
+ASYNC_WARMUP_TIMEOUT = 10.0      # Warm-up inference ka max wait (seconds)
+
+
+def head_pose(matrix):
+    """Facial transformation matrix (4x4) se (yaw, pitch) degrees - 0, 0 = camera ki taraf"""
+    yaw = math.degrees(math.atan2(matrix[0, 2], matrix[2, 2]))
+    pitch = math.degrees(math.asin(max(-1.0, min(1.0, -matrix[1, 2]))))
+    return yaw, pitch
+
+
+class FaceLandmarkerStream:
+    """
+    MediaPipe Tasks FaceLandmarker, LIVE_STREAM mode - FaceDetector ka backend slot
+    process() nahi hai: frames submit() se jaate hain, result callback pe aata hai
+    """
+    name = "mediapipe_tasks"
+    input_color = "rgb"
+
+    def __init__(self, callback, model_path=None, max_faces=MAX_FACES,
+                 blendshapes=ASYNC_OUTPUT_BLENDSHAPES, transforms=HEAD_POSE_CHECK):
+        model_path = model_path or os.path.join(MODEL_DIR, FACE_LANDMARKER_MODEL)
+        if not os.path.isfile(model_path):
+            raise FileNotFoundError(f"Model file nahi mili: {os.path.normpath(model_path)}")
+
+        import mediapipe as mp  # Bhaari import - sirf jab yeh detector chahiye
+        from mediapipe.tasks.python import BaseOptions, vision
+
+        self._mp = mp
+        self.model_path = model_path
+        options = vision.FaceLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_faces=max_faces,
+            min_face_detection_confidence=0.5,
+            min_face_presence_confidence=0.5,
+            min_tracking_confidence=0.5,
+            output_face_blendshapes=blendshapes,
+            output_facial_transformation_matrixes=transforms,
+            result_callback=callback,
+        )
+        self.landmarker = vision.FaceLandmarker.create_from_options(options)
+
+    def submit(self, rgb_frame, timestamp_ms):
+        """Frame bhejo - turant return (mp.Image data copy karta hai, buffer reuse safe)"""
+        image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb_frame)
+        self.landmarker.detect_async(image, timestamp_ms)
+
+    def describe(self):
+        return {"name": self.name, "model": os.path.basename(self.model_path)}
+
+    def close(self):
+        self.landmarker.close()
+
+
+class AsyncFaceDetector(FaceDetector):
+    """
+    FaceDetector jaisa gaze logic, inference MediaPipe Tasks ke apne thread pe
+    submit() turant lautta hai; result register_result_callback wale function ko milta hai
+    Ek frame flight me ho to naye frames drop (Monitor ko hamesha sabse naya frame milta hai)
+    Face gate, keyframe flow aur ROI refinement yaha nahi hain - FaceLandmarker khud
+    detection + tracking karta hai
+    """
+    asynchronous = True
+
+    def __init__(self, model_path=None, inference_width=INFERENCE_WIDTH,
+                 use_tracker=TRACKING_ENABLED, head_pose_check=HEAD_POSE_CHECK,
+                 blendshapes=ASYNC_OUTPUT_BLENDSHAPES):
+        """model_path = face_landmarker.task (None = MODEL_DIR wala)"""
+        stream = FaceLandmarkerStream(
+            self._on_result, model_path=model_path, blendshapes=blendshapes,
+            transforms=head_pose_check,
+        )
+        super().__init__(use_face_gate=False, inference_width=inference_width,
+                         use_tracker=use_tracker, keyframe_interval=1, roi_refine=False,
+                         backend=stream)
+        self.head_pose_check = head_pose_check
+        self._landmark_buf = np.zeros((MAX_FACES, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._facing = np.ones(MAX_FACES, dtype=np.bool_)
+
+        self._lock = threading.Lock()
+        self._pending = {}           # timestamp_ms -> (captured_at, submit perf_counter)
+        self._last_timestamp = -1    # MediaPipe ko strictly badhte timestamps chahiye
+        self._busy_since = None      # Flight wale frame ka submit time (None = free)
+        self._result_callback = None
+        self._unread = None          # analyze_frame() ke liye - aakhri result jo lautaya nahi
+        self._warm_event = None      # warm_up() ka dummy result yaha signal hota hai
+
+        self.submitted = 0
+        self.dropped = 0             # Inference peeche thi - frame bheja hi nahi
+        self.completed = 0
+        self.head_pose_skips = 0     # Kitne faces ka iris check head pose ne bachaya
+        self.last_blendshapes = None  # (K, 52) scores - aakhri result ke faces ke order me
+        self.blendshape_names = None
+        self.last_head_pose = None    # (K, 2) yaw, pitch degrees
+
+    def register_result_callback(self, callback):
+        """callback(result, captured_at, inference_seconds) - MediaPipe ke thread pe chalega"""
+        self._result_callback = callback
+
+    def submit(self, frame, captured_at=None):
+        """
+        BGR frame inference ke liye bhejo - kabhi block nahi karta
+        Returns: False agar pichla frame abhi chal raha tha aur yeh drop hua
+        """
+        now = time.perf_counter()
+        with self._lock:
+            if self._busy_since is not None and now - self._busy_since < ASYNC_STALE_SECONDS:
+                self.dropped += 1
+                return False
+            captured_at = time.time() if captured_at is None else captured_at
+            timestamp_ms = max(int(captured_at * 1000), self._last_timestamp + 1)
+            self._last_timestamp = timestamp_ms
+            self._busy_since = now
+            # Stale frames ke entries (MediaPipe ne khud drop kiye) yaha saaf ho jate hain
+            self._pending = {
+                ts: value for ts, value in self._pending.items()
+                if now - value[1] < ASYNC_STALE_SECONDS
+            }
+            self._pending[timestamp_ms] = (captured_at, now)
+            self.submitted += 1
+
+        with self.timings.stage("preprocess"):
+            rgb = self._preprocess(frame)
+        self.backend.submit(rgb, timestamp_ms)
+        return True
+
+    def analyze_frame(self, frame):
+        """
+        FaceDetector jaisa interface - frame submit karo aur jo naya result aa chuka ho
+        woh lautao (abhi tak kuch nahi aaya to None). Offline/batch ke liye FaceDetector lo
+        """
+        self.submit(frame)
+        with self._lock:
+            result, self._unread = self._unread, None
+        return result
+
+    def _on_result(self, landmarker_result, output_image, timestamp_ms):
+        """MediaPipe callback thread - landmarks se FrameResult, phir Monitor ko"""
+        with self._lock:
+            captured_at, submitted_at = self._pending.pop(timestamp_ms, (None, None))
+            self._busy_since = None
+            warm_event = self._warm_event
+        if warm_event is not None:
+            warm_event.set()  # Warm-up ka dummy frame - tracker/Monitor tak nahi jana
+            return
+
+        try:
+            faces, facing = self._convert(landmarker_result)
+            self.mesh_runs += 1
+            with self.timings.stage("gaze"):
+                result = self._evaluate_faces(faces, output_image.numpy_view(), facing=facing)
+        except Exception as e:
+            log.error("❌ Async result process nahi hua - %s", e)
+            return
+
+        self.completed += 1
+        with self._lock:
+            self._unread = result
+        if self._result_callback is not None:
+            inference = time.perf_counter() - submitted_at if submitted_at is not None else 0.0
+            self._result_callback(result, captured_at, inference)
+
+    def _convert(self, landmarker_result):
+        """FaceLandmarkerResult se (K, N, 3) landmarks aur (K,) facing mask"""
+        face_landmarks = landmarker_result.face_landmarks[:len(self._landmark_buf)]
+        face_count = len(face_landmarks)
+        for i, landmarks in enumerate(face_landmarks):
+            self._landmark_buf[i, :len(landmarks)] = [(lm.x, lm.y, lm.z) for lm in landmarks]
+        faces = self._landmark_buf[:face_count]
+
+        if landmarker_result.face_blendshapes:
+            blendshapes = landmarker_result.face_blendshapes[:face_count]
+            if self.blendshape_names is None:
+                self.blendshape_names = [c.category_name for c in blendshapes[0]]
+            self.last_blendshapes = np.array(
+                [[c.score for c in categories] for categories in blendshapes], dtype=np.float32
+            )
+
+        facing = None
+        matrixes = landmarker_result.facial_transformation_matrixes
+        if self.head_pose_check and matrixes:
+            poses = np.array([head_pose(m) for m in matrixes[:face_count]], dtype=np.float32)
+            facing = self._facing[:face_count]
+            np.logical_and(np.abs(poses[:, 0]) <= HEAD_YAW_LIMIT,
+                           np.abs(poses[:, 1]) <= HEAD_PITCH_LIMIT, out=facing)
+            self.head_pose_skips += int(face_count - facing.sum())
+            self.last_head_pose = poses
+        return faces, facing
+
+    def warm_up(self, shape=(480, 640, 3)):
+        """Dummy frame ka inference - graph ban jaye, result kahin nahi jata"""
+        event = threading.Event()
+        self._warm_event = event
+        try:
+            self.submit(np.zeros(shape, dtype=np.uint8))
+            if not event.wait(ASYNC_WARMUP_TIMEOUT):
+                log.warning("⚠ Warning: FaceLandmarker warm-up ka result nahi aaya")
+        finally:
+            self._warm_event = None
+
+    def get_stats(self):
+        """Submit/drop/complete counters"""
+        return {
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "completed": self.completed,
+            "head_pose_skips": self.head_pose_skips,
+        }
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from collections import deque
+
+# Configuration Constants - asyncio fan-out
+STREAM_QUEUE_MAX = 64       # Har subscriber ki queue - bhar jaye to sabse purana drop
+
+
+class _Subscriber:
+    """Ek async consumer - apni bounded deque aur apne event loop ka wake-up"""
+    def __init__(self, loop, maxlen):
+        self.loop = loop
+        self.items = deque(maxlen=maxlen)
+        self.ready = asyncio.Event()
+        self.signalled = False   # Wake-up already schedule hai - har item pe dobara nahi
+        self.closed = False
+        self.dropped = 0
+
+    def push(self, item):
+        """Kisi bhi thread se - deque full ho to sabse purana gir jata hai"""
+        if len(self.items) == self.items.maxlen:
+            self.dropped += 1
+        self.items.append(item)
+        self._wake()
+
+    def close(self):
+        self.closed = True
+        self._wake()
+
+    def _wake(self):
+        if self.signalled:
+            return
+        self.signalled = True
+        try:
+            self.loop.call_soon_threadsafe(self.ready.set)
+        except RuntimeError:
+            self.closed = True  # Consumer ka loop band ho chuka
+
+
+class AsyncStream:
+    """
+    Worker threads se asyncio consumers tak fan-out - har subscriber ki apni bounded queue
+    publish() kabhi block nahi karta: slow consumer ke purane items drop hote hain
+    (detection thread consumer ki wajah se kabhi nahi rukta), baaki subscribers pe asar nahi
+    Koi thread per consumer nahi - wake-up consumer ke apne event loop pe aata hai
+    """
+    def __init__(self, maxlen=STREAM_QUEUE_MAX):
+        self.maxlen = maxlen
+        self._subscribers = ()   # Copy-on-write tuple - publish me lock nahi chahiye
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def publish(self, item):
+        """Kisi bhi thread se - har subscriber ki queue me daalo"""
+        self.published += 1
+        for subscriber in self._subscribers:
+            subscriber.push(item)
+
+    async def subscribe(self, maxlen=None):
+        """
+        async for item in stream.subscribe() - close() tak items deta hai
+        Pehle __anext__ pe register hota hai, usse pehle ke items nahi milte
+        """
+        subscriber = _Subscriber(asyncio.get_running_loop(), maxlen or self.maxlen)
+        with self._lock:
+            self._subscribers = self._subscribers + (subscriber,)
+        try:
+            while True:
+                while subscriber.items:
+                    yield subscriber.items.popleft()
+                # Pehle flag hatao, phir dobara dekho - beech me aaya item wake-up schedule karega
+                subscriber.signalled = False
+                subscriber.ready.clear()
+                if subscriber.items:
+                    continue
+                if subscriber.closed:
+                    return
+                await subscriber.ready.wait()
+        finally:
+            with self._lock:
+                self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
+
+    def close(self):
+        """Abhi ke saare subscribers ko khatam karo (bache items pehle mil jayenge)"""
+        for subscriber in self._subscribers:
+            subscriber.close()
+
+    def get_stats(self):
+        """Subscribers, unki queue depth aur drops"""
+        subscribers = self._subscribers
+        return {
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "depth": [len(s.items) for s in subscribers],
+            "dropped": sum(s.dropped for s in subscribers),
+        }
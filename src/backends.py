@@ -0,0 +1,256 @@
+import os
+
+import cv2
+import numpy as np
+
+from mesh_refinement import refine_landmarks
+
+# Configuration Constants - inference backends
+INFERENCE_BACKEND = "mediapipe"  # BACKENDS me se ek naam
+BACKEND_THREADS = None           # CPU threads (None = library ka default)
+MAX_FACES = 5                    # Ek frame me max kitne faces
+NUM_LANDMARKS = 478              # 468 mesh points + 10 iris points (refined)
+
+# OpenCV DNN backend - YuNet face detector + 478-point landmark model (ONNX files)
+MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "models")
+DNN_DETECTOR_MODEL = "face_detection_yunet_2023mar.onnx"
+DNN_LANDMARK_MODEL = "face_landmark_with_attention.onnx"  # MediaPipe attention mesh ka ONNX export
+DNN_LANDMARK_INPUT = 192         # Landmark model ka input size (square, RGB, [0, 1] float)
+DNN_LANDMARK_LAYOUT = "NHWC"     # Export ka input layout - TFLite/tf2onnx wala NHWC, ya "NCHW"
+DNN_DETECTION_CONFIDENCE = 0.6   # YuNet score threshold
+DNN_PRESENCE_THRESHOLD = 0.5     # Landmark model ka face flag (sigmoid) isse kam = crop me face nahi
+DNN_CROP_SCALE = 1.5             # Landmark crop face box se itna bada (MediaPipe jaisa context)
+DNN_RUNTIME = "opencv"           # Landmark model "opencv" (cv2.dnn) ya "onnxruntime" pe chalao
+
+# Attention model ke named outputs - mesh (468x3) aur refinements (2D), crop pixels me.
+# forward() sirf pehla output deta hai, isliye saare naam se maangne padte hain
+DNN_LANDMARK_OUTPUTS = (
+    "output_mesh_identity", "output_lips", "output_left_eye", "output_right_eye",
+    "output_left_iris", "output_right_iris", "conv_faceflag",
+)
+
+_NO_FACES = np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32)
+
+# Serialized NormalizedLandmarkList ka fixed wire layout - har landmark 17 bytes:
+# [0x0a, 0x0f] (field tag + length) phir x, y, z har ek apne 1 byte tag ke saath.
+# Isse protobuf se seedha np.frombuffer ho jata hai - 478 Python objects walk nahi karne padte
+_LANDMARK_WIRE_DTYPE = np.dtype([
+    ("tag", "u1"), ("size", "u1"),
+    ("x_tag", "u1"), ("x", "<f4"),
+    ("y_tag", "u1"), ("y", "<f4"),
+    ("z_tag", "u1"), ("z", "<f4"),
+])
+_LANDMARK_WIRE_TAG_COLUMNS = np.array([0, 1, 2, 7, 12], dtype=np.intp)
+_LANDMARK_WIRE_TAGS = np.array([0x0a, 0x0f, 0x0d, 0x15, 0x1d], dtype=np.uint8)
+
+
+def landmarks_to_array(face_landmarks, out=None):
+    """
+    Ek face ke MediaPipe landmarks ko (N, 3) float32 array me convert karo
+    Fast path protobuf bytes seedha padhta hai, warna normal loop fallback
+    """
+    landmarks = face_landmarks.landmark
+    n = len(landmarks)
+    if out is None:
+        out = np.empty((n, 3), dtype=np.float32)
+    else:
+        out = out[:n]
+
+    raw = face_landmarks.SerializeToString()
+    if len(raw) == n * _LANDMARK_WIRE_DTYPE.itemsize:
+        raw_bytes = np.frombuffer(raw, dtype=np.uint8).reshape(n, _LANDMARK_WIRE_DTYPE.itemsize)
+        # Sabhi tag bytes ek saath check karo - layout match hua tabhi fast path
+        if (raw_bytes[:, _LANDMARK_WIRE_TAG_COLUMNS] == _LANDMARK_WIRE_TAGS).all():
+            wire = np.frombuffer(raw, dtype=_LANDMARK_WIRE_DTYPE)
+            out[:, 0] = wire["x"]
+            out[:, 1] = wire["y"]
+            out[:, 2] = wire["z"]
+            return out
+
+    # Fallback - layout alag hai (jaise visibility field set hai) to seedha padho
+    for j, lm in enumerate(landmarks):
+        out[j, 0] = lm.x
+        out[j, 1] = lm.y
+        out[j, 2] = lm.z
+    return out
+
+
+class MediaPipeBackend:
+    """
+    MediaPipe FaceMesh (refine_landmarks=True) - default backend
+    Legacy solutions API thread count configure nahi karne deta, num_threads ignore hota hai
+    """
+    name = "mediapipe"
+    input_color = "rgb"
+
+    def __init__(self, max_faces=MAX_FACES, static_image_mode=False, num_threads=BACKEND_THREADS):
+        import mediapipe as mp  # Bhaari import - sirf jab yeh backend chahiye
+
+        self.num_threads = num_threads
+        self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=static_image_mode,
+            max_num_faces=max_faces,      # Maximum itne faces detect kar sakte hain
+            refine_landmarks=True,        # Iris landmarks bhi chahiye
+            min_detection_confidence=0.5, # Detection confidence threshold
+            min_tracking_confidence=0.5   # Tracking confidence threshold
+        )
+        # Preallocated landmark buffer - har frame pe reuse hoga
+        self._landmark_buf = np.zeros((max_faces, NUM_LANDMARKS, 3), dtype=np.float32)
+
+    def process(self, rgb_frame):
+        """Frame ke sabhi faces - (K, N, 3) normalized landmarks (buffer ka view)"""
+        results = self.face_mesh.process(rgb_frame)
+        if not results.multi_face_landmarks:
+            return _NO_FACES
+        face_count = min(len(results.multi_face_landmarks), len(self._landmark_buf))
+        for i in range(face_count):
+            landmarks_to_array(results.multi_face_landmarks[i], out=self._landmark_buf[i])
+        return self._landmark_buf[:face_count]
+
+    def describe(self):
+        return {"name": self.name, "threads": None}
+
+    def close(self):
+        self.face_mesh.close()
+
+
+def _match_outputs(available, wanted=DNN_LANDMARK_OUTPUTS):
+    """Model ke output names me se wanted wale (export ":0" jaisa suffix laga deta hai)"""
+    by_name = {name.split(":")[0]: name for name in available}
+    missing = [name for name in wanted if name not in by_name]
+    if missing:
+        raise ValueError(
+            f"Landmark model me outputs nahi mile: {', '.join(missing)} "
+            f"(model ke outputs: {', '.join(available)}) - attention mesh export chahiye"
+        )
+    return [by_name[name] for name in wanted]
+
+
+class OpenCVDNNBackend:
+    """
+    Pure OpenCV backend - YuNet (cv2.FaceDetectorYN) se faces, phir har face ke crop pe
+    attention landmark model (cv2.dnn ya ONNX Runtime CPU). Models MODEL_DIR me hone chahiye
+    (fetch_models.py). MediaPipe graph jaisa: crop aankhon ki line pe seedha ghumaya jata hai,
+    mesh + lips/eyes/irises 478 points me jodte hain, face flag kam ho to face chhod dete hain
+    """
+    name = "opencv_dnn"
+    input_color = "bgr"  # YuNet BGR pe train hua hai - RGB conversion ki zarurat nahi
+
+    def __init__(self, max_faces=MAX_FACES, static_image_mode=False, num_threads=BACKEND_THREADS,
+                 model_dir=MODEL_DIR, runtime=DNN_RUNTIME):
+        detector_path = os.path.join(model_dir, DNN_DETECTOR_MODEL)
+        landmark_path = os.path.join(model_dir, DNN_LANDMARK_MODEL)
+        for path in (detector_path, landmark_path):
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"Model file nahi mili: {os.path.normpath(path)}")
+
+        self.max_faces = max_faces
+        self.num_threads = num_threads
+        self.runtime = runtime
+        if num_threads:
+            cv2.setNumThreads(num_threads)
+
+        self.face_detector = cv2.FaceDetectorYN.create(
+            detector_path, "", (320, 320), DNN_DETECTION_CONFIDENCE, 0.3, 5000
+        )
+        self._input_size = None
+
+        if runtime == "onnxruntime":
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            if num_threads:
+                options.intra_op_num_threads = num_threads
+            session = ort.InferenceSession(
+                landmark_path, options, providers=["CPUExecutionProvider"]
+            )
+            input_name = session.get_inputs()[0].name
+            outputs = _match_outputs([output.name for output in session.get_outputs()])
+            self._run_landmarks = lambda blob: session.run(outputs, {input_name: blob})
+        else:
+            net = cv2.dnn.readNetFromONNX(landmark_path)
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+            net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            outputs = _match_outputs(list(net.getUnconnectedOutLayersNames()))
+
+            def run(blob):
+                net.setInput(blob)
+                return net.forward(outputs)
+            self._run_landmarks = run
+
+        size = DNN_LANDMARK_INPUT
+        self._crop = np.empty((size, size, 3), dtype=np.uint8)
+        self._points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)  # Crop pixels me
+        self._landmark_buf = np.zeros((max_faces, NUM_LANDMARKS, 3), dtype=np.float32)
+
+    def process(self, bgr_frame):
+        """Frame ke sabhi faces - (K, N, 3) normalized landmarks (buffer ka view)"""
+        h, w = bgr_frame.shape[:2]
+        if self._input_size != (w, h):
+            self.face_detector.setInputSize((w, h))
+            self._input_size = (w, h)
+        _, detections = self.face_detector.detect(bgr_frame)
+        if detections is None or not len(detections):
+            return _NO_FACES
+
+        # Sabse confident faces pehle - YuNet ka score aakhri column hai
+        detections = detections[np.argsort(-detections[:, -1])][:self.max_faces]
+        size = DNN_LANDMARK_INPUT
+        count = 0
+        for x, y, box_w, box_h, right_x, right_y, left_x, left_y in detections[:, :8]:
+            # Face ke around square crop, aankhon ki line horizontal (MediaPipe ka ROI rotation).
+            # Frame ke bahar wala hissa kaala (warpAffine border)
+            side = max(box_w, box_h) * DNN_CROP_SCALE
+            center = np.array([x + box_w / 2, y + box_h / 2], dtype=np.float32)
+            angle = np.arctan2(left_y - right_y, left_x - right_x)
+            cos, sin = np.cos(angle), np.sin(angle)
+            scale = size / side
+            rotation = np.array([[cos, sin], [-sin, cos]], dtype=np.float32) * scale
+            transform = np.empty((2, 3), dtype=np.float32)
+            transform[:, :2] = rotation
+            transform[:, 2] = size / 2 - rotation @ center
+            cv2.warpAffine(bgr_frame, transform, (size, size), dst=self._crop,
+                           flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT)
+
+            # Model RGB, [0, 1] float leta hai
+            blob = cv2.dnn.blobFromImage(self._crop, 1.0 / 255.0, swapRB=True)  # NCHW RGB
+            if DNN_LANDMARK_LAYOUT == "NHWC":
+                blob = np.ascontiguousarray(blob.transpose(0, 2, 3, 1))
+            *landmarks, face_flag = self._run_landmarks(blob)
+            presence = 1.0 / (1.0 + np.exp(-float(np.ravel(face_flag)[0])))
+            if presence < DNN_PRESENCE_THRESHOLD:
+                continue
+            points = refine_landmarks(self._points, *landmarks)
+
+            # Crop pixels se poore frame ke normalized coords - rotation/scale ulta karo
+            out = self._landmark_buf[count]
+            # rotation = R * scale, R orthogonal - ulta (R * scale)^-1 = R^T / scale^2
+            frame_xy = (points[:, :2] - size / 2) @ rotation / (scale * scale) + center
+            out[:, 0] = frame_xy[:, 0] / w
+            out[:, 1] = frame_xy[:, 1] / h
+            out[:, 2] = points[:, 2] / scale / w
+            count += 1
+        return self._landmark_buf[:count]
+
+    def describe(self):
+        return {"name": self.name, "threads": self.num_threads, "runtime": self.runtime}
+
+    def close(self):
+        """OpenCV objects garbage collector ke saath free ho jate hain"""
+
+
+# OpenCVDNNBackend abhi register nahi hai - attention mesh ka aisa ONNX export milta hi nahi jisme
+# standard ops aur DNN_LANDMARK_OUTPUTS wale naam hon (fetch_models.py). Export mil jaye aur
+# smoke check pass ho tab yaha jodo; tab tak class seedha object bana ke hi use hoti hai
+BACKENDS = {
+    MediaPipeBackend.name: MediaPipeBackend,
+}
+
+
+def create_backend(name=INFERENCE_BACKEND, **kwargs):
+    """Naam se backend banao - galat naam pe ValueError"""
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {name} (available: {', '.join(BACKENDS)})")
+    return backend_class(**kwargs)
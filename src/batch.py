@@ -0,0 +1,165 @@
+import queue
+import threading
+
+import numpy as np
+
+from frame_source import VideoFileSource
+
+# Configuration Constants - offline batch analysis
+BATCH_PREFETCH = 8          # Decode thread inference se itne frames aage reh sakta hai
+INITIAL_CAPACITY = 1024     # Result columns ki shuruaati length (zarurat pe double)
+
+_END = object()  # Decode thread ka "frames khatam" signal
+
+
+def prefetch_frames(source, depth=BATCH_PREFETCH):
+    """
+    Source ke frames background thread me decode karo - (frame, timestamp) generator
+    Decode aur inference parallel chalte hain, beech me bounded queue (depth frames)
+    Frames ek chhote buffer pool me reuse hote hain - yielded frame agle next() tak valid hai
+    timestamp = source.position() agar source deta hai, warna None
+    """
+    if not source.is_opened() and not source.open():
+        raise IOError(f"Source nahi khula: {source.describe()}")
+
+    ready = queue.Queue(maxsize=depth)
+    free = queue.Queue()
+    pool = [None] * (depth + 2)  # Queue me depth + consumer ke paas 1 + decode ho raha 1
+    for index in range(len(pool)):
+        free.put(index)
+    stop = threading.Event()
+    errors = []
+
+    def decode():
+        try:
+            while not stop.is_set():
+                if not source.grab():
+                    if source.exhausted or source.live:
+                        break
+                    continue
+                index = free.get()
+                ret, frame = source.retrieve(pool[index])
+                if not ret:
+                    free.put(index)
+                    continue
+                pool[index] = frame
+                position = getattr(source, "position", None)
+                ready.put((index, position() if position else None))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            ready.put(_END)
+
+    thread = threading.Thread(target=decode, daemon=True)
+    thread.start()
+    held = None
+    try:
+        while True:
+            item = ready.get()
+            if held is not None:
+                free.put(held)  # Pichla frame consumer ne chhod diya
+                held = None
+            if item is _END:
+                break
+            held, timestamp = item
+            yield pool[held], timestamp
+    finally:
+        # Consumer beech me ruk gaya ho to decode thread ko bhi rokna hai
+        stop.set()
+        if held is not None:
+            free.put(held)
+        while thread.is_alive():
+            try:
+                item = ready.get(timeout=0.1)
+                if item is not _END:
+                    free.put(item[0])
+            except queue.Empty:
+                pass
+        source.release()
+    if errors:
+        raise errors[0]
+
+
+class ResultColumns:
+    """
+    analyze_frame results ko columnar NumPy arrays me jodo - har frame pe dict list nahi
+    Arrays zarurat pe double hote hain, aakhir me sirf bhara hua hissa milta hai
+    """
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.size = 0
+        self.timestamp = np.empty(capacity, dtype=np.float64)
+        self.face_count = np.empty(capacity, dtype=np.int16)
+        self.peeking = np.empty(capacity, dtype=np.bool_)
+        self.confidence = np.empty(capacity, dtype=np.float32)
+
+    def _grow(self):
+        """Saare columns ki capacity double karo"""
+        capacity = 2 * len(self.timestamp)
+        for name in ("timestamp", "face_count", "peeking", "confidence"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def append(self, timestamp, result):
+        """Ek frame ka result jodo"""
+        if self.size == len(self.timestamp):
+            self._grow()
+        i = self.size
+        self.timestamp[i] = timestamp
+        self.face_count[i] = result.face_count
+        self.peeking[i] = result.peeking
+        self.confidence[i] = result.confidence
+        self.size += 1
+
+    def to_dict(self):
+        """{column: array} - sirf bhare hue rows (copy, taaki bada buffer free ho jaye)"""
+        return {
+            "timestamp": self.timestamp[:self.size].copy(),
+            "face_count": self.face_count[:self.size].copy(),
+            "peeking": self.peeking[:self.size].copy(),
+            "confidence": self.confidence[:self.size].copy(),
+        }
+
+
+def analyze_batch(detector, frames, timestamps=None, fps=None):
+    """
+    Bahut saare frames ek detector se - offline audit aur threshold tuning ke liye
+    frames = koi bhi iterable (generator bhi chalega), ya (frame, timestamp) pairs
+    timestamps = frames jitne timestamps; None ho to frame index / fps (fps na ho to index)
+    Returns: {"timestamp", "face_count", "peeking", "confidence"} NumPy arrays
+    """
+    columns = ResultColumns()
+    timestamps = iter(timestamps) if timestamps is not None else None
+
+    # Offline run - har face ka print nahi chahiye, aur pichle session ke track IDs bhi nahi
+    verbose = detector.verbose
+    detector.verbose = False
+    if detector.tracker is not None:
+        detector.tracker.reset()
+    try:
+        for index, item in enumerate(frames):
+            frame, timestamp = item if isinstance(item, tuple) else (item, None)
+            if timestamps is not None:
+                timestamp = next(timestamps)
+            if timestamp is None:
+                timestamp = index / fps if fps else float(index)
+            columns.append(timestamp, detector.analyze_frame(frame))
+    finally:
+        detector.verbose = verbose
+    return columns.to_dict()
+
+
+def analyze_video(detector, path, max_frames=None, prefetch=BATCH_PREFETCH):
+    """
+    Video file ka poora audit - decode background thread me, inference is thread me
+    Returns: analyze_batch jaise columnar arrays, timestamp = video position (seconds)
+    """
+    decoded = prefetch_frames(VideoFileSource(path), depth=prefetch)
+    frames = decoded
+    if max_frames is not None:
+        frames = (item for _, item in zip(range(max_frames), decoded))
+    try:
+        return analyze_batch(detector, frames)
+    finally:
+        decoded.close()
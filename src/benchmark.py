@@ -0,0 +1,277 @@
+"""
+Offline replay aur throughput benchmark - webcam ke bina detector test karo
+
+Examples:
+    python benchmark.py --synthetic 300
+    python benchmark.py --video session.mp4 --output report.json
+    python benchmark.py --images frames/ --fps 20 --no-gate
+    python benchmark.py --video session.mp4 --backend mediapipe --threads 2
+
+Kai backends ho to har ek apne process me chalta hai - peak RSS ek doosre me nahi judta
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from backends import BACKENDS, BACKEND_THREADS, INFERENCE_BACKEND
+from detector import FaceDetector
+from frame_source import ImageSequenceSource, MemorySource, VideoFileSource
+from landmark_flow import KEYFRAME_INTERVAL
+from monitor import Monitor, FPS_EST, REQUIRED_SECONDS
+
+# Configuration Constants - benchmark defaults
+SYNTHETIC_FRAMES = 300         # --synthetic ka default frame count
+FRAME_WIDTH = 640              # Synthetic frames ka size
+FRAME_HEIGHT = 480
+WARMUP_FRAMES = 5              # Itne frames stats me count nahi honge (model warm-up)
+
+
+def synthetic_frames(count, width=FRAME_WIDTH, height=FRAME_HEIGHT, seed=0):
+    """Deterministic synthetic frames - moving blob + noise, reproducible runs ke liye"""
+    rng = np.random.default_rng(seed)
+    background = rng.integers(0, 60, size=(height, width, 3), dtype=np.uint8)
+    for i in range(count):
+        frame = background.copy()
+        x = int((i * 7) % width)
+        cv2.circle(frame, (x, height // 2), 60, (200, 180, 160), -1)
+        yield frame
+
+
+def peak_rss_mb():
+    """Process ka peak resident memory (MB) - platform support na ho to None"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux pe KB, macOS pe bytes
+        if sys.platform == "darwin":
+            return peak / (1024 * 1024)
+        return peak / 1024
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+
+def latency_summary(latencies):
+    """Per-frame latencies (seconds) se ms me summary"""
+    if len(latencies) == 0:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ms = np.asarray(latencies) * 1000.0
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "mean": float(ms.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(ms.max()),
+    }
+
+
+def run_benchmark(source, fps=FPS_EST, required_seconds=REQUIRED_SECONDS,
+                  use_face_gate=True, warmup=WARMUP_FRAMES, max_frames=None,
+                  keyframe_interval=KEYFRAME_INTERVAL, inference_width=None, roi_refine=False,
+                  backend=INFERENCE_BACKEND, num_threads=BACKEND_THREADS):
+    """
+    Source ke frames ko analyze_frame + Monitor decision logic se guzaaro aur report banao
+    Decision logic simulated clock pe chalta hai (frame_index / fps) - reproducible alerts
+    """
+    detector = FaceDetector(use_face_gate=use_face_gate, keyframe_interval=keyframe_interval,
+                            inference_width=inference_width, roi_refine=roi_refine,
+                            backend=backend, num_threads=num_threads)
+    monitor = Monitor(required_seconds=required_seconds, detector=detector, source=source)
+
+    # Alert events record karo - simulated time ke saath
+    alerts = []
+    sim_clock = {"t": 0.0, "frame": 0}
+
+    def on_alert(event):
+        alerts.append({
+            "alert": bool(event.get("alert")),
+            "frame": sim_clock["frame"],
+            "time": sim_clock["t"],
+            "duration": event.get("duration"),
+        })
+
+    monitor.register_callback(on_alert)
+    monitor.scheduler.reset(now=0.0)  # Scheduler bhi simulated clock pe
+
+    latencies = []
+    peeking_frames = 0
+    processed = 0
+    start = None
+
+    try:
+        for index, frame in enumerate(source.frames()):
+            if max_frames is not None and index >= max_frames:
+                break
+
+            sim_clock["frame"] = index
+            sim_clock["t"] = index / fps
+
+            t0 = time.perf_counter()
+            result = detector.analyze_frame(frame)
+            monitor._process_result(result, sim_clock["t"])
+            elapsed = time.perf_counter() - t0
+
+            # Warm-up frames stats me nahi ginte
+            if index < warmup:
+                continue
+            if start is None:
+                start = time.perf_counter() - elapsed
+
+            latencies.append(elapsed)
+            processed += 1
+            if result.peeking:
+                peeking_frames += 1
+
+        wall = (time.perf_counter() - start) if start is not None else 0.0
+        detector_stats = {
+            "mesh_runs": detector.mesh_runs,
+            "gate_skips": detector.gate_skips,
+            "backend": detector.backend.describe(),
+        }
+        if detector.roi_backend is not None:
+            detector_stats["roi_runs"] = detector.roi_runs
+            detector_stats["roi_refined"] = detector.roi_refined
+        if detector.flow is not None:
+            detector_stats["flow"] = detector.flow.get_stats()
+    finally:
+        monitor.cleanup()
+
+    return {
+        "frames": processed,
+        "wall_seconds": wall,
+        "fps": processed / wall if wall > 0 else 0.0,
+        "latency_ms": latency_summary(latencies),
+        "peak_rss_mb": peak_rss_mb(),
+        "peeking_frames": peeking_frames,
+        "alerts": alerts,
+        "detector": detector_stats,
+        "scheduler": monitor.scheduler.get_stats(now=sim_clock["t"]),
+    }
+
+
+def make_source(args):
+    """CLI args se frame source - har backend run ko same frames shuru se chahiye"""
+    if args.video:
+        return VideoFileSource(args.video)
+    if args.images:
+        return ImageSequenceSource(args.images)
+    count = args.synthetic or SYNTHETIC_FRAMES
+    return MemorySource(synthetic_frames(count))
+
+
+def run_backend(args, backend):
+    """Ek backend ka poora benchmark (module level - spawn process me bhi chal sake)"""
+    source = make_source(args)
+    result = run_benchmark(
+        source,
+        fps=args.fps,
+        required_seconds=args.required_seconds,
+        use_face_gate=not args.no_gate,
+        warmup=args.warmup,
+        max_frames=args.max_frames,
+        keyframe_interval=args.keyframe_interval,
+        inference_width=args.inference_width,
+        roi_refine=args.roi_refine,
+        backend=backend,
+        num_threads=args.threads,
+    )
+    result["source"] = source.describe()
+    return result
+
+
+def run_isolated(args, backend):
+    """
+    Naye process me run_backend - ru_maxrss poore process ka lifetime peak hai,
+    alag process me hi har backend ka apna peak milta hai
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+        return executor.submit(run_backend, args, backend).result()
+
+
+def main(argv=None):
+    """Command line entry point - JSON report stdout ya file me"""
+    parser = argparse.ArgumentParser(description="KaunHaiBe detector benchmark")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--video", help="Video file replay karo")
+    source.add_argument("--images", help="Image directory replay karo")
+    source.add_argument("--synthetic", type=int, metavar="N",
+                        help=f"N synthetic frames (default {SYNTHETIC_FRAMES})")
+    parser.add_argument("--fps", type=float, default=FPS_EST,
+                        help="Decision logic ke liye simulated frame rate")
+    parser.add_argument("--required-seconds", type=float, default=REQUIRED_SECONDS)
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--warmup", type=int, default=WARMUP_FRAMES)
+    parser.add_argument("--no-gate", action="store_true",
+                        help="Face-count gate band karo (har frame pe FaceMesh)")
+    parser.add_argument("--keyframe-interval", type=int, default=KEYFRAME_INTERVAL,
+                        help="Full mesh har N frames, beech me optical flow (1 = band)")
+    parser.add_argument("--inference-width", type=int, default=None,
+                        help="Mesh se pehle frame ko is width tak downscale karo")
+    parser.add_argument("--roi-refine", action="store_true",
+                        help="Secondary faces ke landmarks native-resolution crop pe refine karo")
+    parser.add_argument("--backend", default=INFERENCE_BACKEND,
+                        help=f"Inference backend(s), comma se alag - {', '.join(BACKENDS)}")
+    parser.add_argument("--threads", type=int, default=BACKEND_THREADS,
+                        help="Backend ke CPU threads (None = library default)")
+    parser.add_argument("--output", help="JSON report is file me likho")
+    args = parser.parse_args(argv)
+
+    backends = [name.strip() for name in args.backend.split(",") if name.strip()]
+    if len(backends) == 1:
+        report = run_backend(args, backends[0])
+    else:
+        # Backends side-by-side, har ek alag process me (memory peak alag naapne ke liye) -
+        # jo load na ho (model file / dependency missing) uska error
+        report = {"backends": {}}
+        for backend in backends:
+            try:
+                report["backends"][backend] = run_isolated(args, backend)
+            except (ValueError, FileNotFoundError, ImportError, cv2.error) as e:
+                report["backends"][backend] = {"error": str(e)}
+    report["config"] = {
+        "fps": args.fps,
+        "required_seconds": args.required_seconds,
+        "face_gate": not args.no_gate,
+        "keyframe_interval": args.keyframe_interval,
+        "inference_width": args.inference_width,
+        "roi_refine": args.roi_refine,
+        "backend": backends,
+        "threads": args.threads,
+        "warmup": args.warmup,
+    }
+    report["platform"] = {
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "opencv": cv2.__version__,
+        "numpy": np.__version__,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+        print(f"✓ Benchmark report likh di: {args.output}")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
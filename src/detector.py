@@ -1,70 +1,235 @@
 import cv2
-import mediapipe as mp
 import numpy as np
 
+from app_logging import PER_FRAME, get_logger
+from backends import BACKEND_THREADS, INFERENCE_BACKEND, MAX_FACES, create_backend
+from timing import StageTimings
+from tracker import FaceTracker
+from landmark_flow import LandmarkFlow, KEYFRAME_INTERVAL
+from results import FaceObservation, FrameResult, NO_FACES, NO_FRAME, SINGLE_FACE
+
+log = get_logger("detector")
+
 # Configuration Constants - yeh values tune kar sakte ho
 GAZE_THRESHOLD_CENTER = 0.35  # Kitna center me dekhna chahiye (kam value = zyada strict)
 PERIPHERAL_MARGIN = 0.25       # Peripheral vision ka margin
 MIN_EYE_VISIBILITY = 0.4       # Minimum eye visibility required
 
+# Face-count gate - mehenga FaceMesh sirf tab chalega jab 2+ faces hon
+FACE_GATE_ENABLED = True       # Gate on/off
+FACE_GATE_WIDTH = 320          # Gate ke liye frame ko itni width tak chhota karo
+FACE_GATE_MODEL = 0            # 0 = short-range (~2m), 1 = full-range (~5m)
+FACE_GATE_CONFIDENCE = 0.4     # Mesh (0.5) se thoda kam - doubt ho to mesh chala do
+FACE_GATE_HOLD_FRAMES = 10     # Mesh ne 2+ faces dekhe to itne frames tak gate bypass
+FACE_GATE_RECHECK_FRAMES = 30  # Har itne frames me ek baar mesh zaroor chalao (safety net)
+
+# Tracking - faces ko frames ke across stable ID do, primary user lock karo
+TRACKING_ENABLED = True
+
+# Preprocessing - None = native resolution pe inference, warna itni width tak downscale
+INFERENCE_WIDTH = None
+
+# Multi-resolution - downscaled frame pe faces dhoondo, secondary faces ka iris native crop pe
+ROI_REFINE_ENABLED = False  # Door wale (chhote) faces ke liye native-resolution refinement
+ROI_PADDING = 0.3           # Crop face bbox se har taraf itna (face size ka fraction) bada
+ROI_SIZE = 192              # Crop ko is square size me resize karke mesh chalao
+ROI_MIN_GAIN = 1.5          # Native crop mesh input se kam se kam itna guna detail de tabhi refine
+
+_NO_BBOXES = np.zeros((0, 4), dtype=np.float32)
+
+
+def _reuse_buffer(buffer, shape):
+    """Buffer ka shape match kare to wahi lo, warna ek baar naya banao"""
+    if buffer is None or buffer.shape != shape:
+        return np.empty(shape, dtype=np.uint8)
+    return buffer
+
+
+def iris_positions(faces, iris_indices, eye_indices):
+    """
+    Vectorized iris position - faces (K, N, 3) ke liye (K, 2) normalized positions
+    0.5 = center, eye ki width/height zero ho to default center
+    """
+    iris = faces[:, iris_indices, :2].mean(axis=1)
+    eye = faces[:, eye_indices, :2]
+    eye_min = eye.min(axis=1)
+    eye_span = eye.max(axis=1) - eye_min
+
+    # Zero span pe divide mat karo - waha 0.5 (center) rakho
+    valid = eye_span > 0
+    safe_span = np.where(valid, eye_span, 1.0)
+    return np.where(valid, (iris - eye_min) / safe_span, 0.5)
+
+
 class FaceDetector:
-    def __init__(self):
-        """Face detector initialize karo - MediaPipe use karenge"""
-        # MediaPipe face mesh setup karo
-        self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=5,              # Maximum 5 faces detect kar sakte hain
-            refine_landmarks=True,        # Iris landmarks bhi chahiye
-            min_detection_confidence=0.5, # Detection confidence threshold
-            min_tracking_confidence=0.5   # Tracking confidence threshold
-        )
+    def __init__(self, use_face_gate=FACE_GATE_ENABLED, inference_width=INFERENCE_WIDTH,
+                 use_tracker=TRACKING_ENABLED, keyframe_interval=KEYFRAME_INTERVAL,
+                 roi_refine=ROI_REFINE_ENABLED, backend=INFERENCE_BACKEND,
+                 num_threads=BACKEND_THREADS, static_image_mode=False):
+        """
+        Face detector initialize karo - landmarks inference backend se (default MediaPipe)
+        inference_width = mesh se pehle frame ko is width tak downscale karo (None = native)
+        use_tracker = faces ko stable IDs do (primary lock + per-observer timers ke liye)
+        keyframe_interval = N > 1 pe full mesh har N frames, beech me iris/eye optical flow
+        roi_refine = secondary faces ke landmarks native-resolution crop pe dobara nikalo
+                     (inference_width ke saath use karo - jaise 1080p capture, 640 mesh)
+        backend = backends.BACKENDS ka naam ("mediapipe") ya bana hua backend object,
+                  num_threads = CPU threads
+        static_image_mode = True pe backend frames ke beech apni tracking state nahi rakhta
+                            (ek detector kai cameras ke frames dekhe tab zaruri)
+        """
+        # Landmark backend - (K, N, 3) normalized landmarks deta hai
+        if isinstance(backend, str):
+            backend = create_backend(backend, max_faces=MAX_FACES, num_threads=num_threads,
+                                     static_image_mode=static_image_mode)
+        self.backend = backend
         
         # Iris landmark indices - left aur right eye ke centers
-        self.LEFT_IRIS = [469, 470, 471, 472]   # Left iris ke 4 points
-        self.RIGHT_IRIS = [474, 475, 476, 477]  # Right iris ke 4 points
+        self.LEFT_IRIS = np.array([469, 470, 471, 472], dtype=np.intp)   # Left iris ke 4 points
+        self.RIGHT_IRIS = np.array([474, 475, 476, 477], dtype=np.intp)  # Right iris ke 4 points
         
         # Eye region landmarks - puri eye ka boundary
-        self.LEFT_EYE = [33, 133, 160, 159, 158, 144, 145, 153]
-        self.RIGHT_EYE = [362, 263, 387, 386, 385, 373, 374, 380]
+        self.LEFT_EYE = np.array([33, 133, 160, 159, 158, 144, 145, 153], dtype=np.intp)
+        self.RIGHT_EYE = np.array([362, 263, 387, 386, 385, 373, 374, 380], dtype=np.intp)
+        
+        # Gaze ke liye sirf yeh points chahiye - keyframe mode inhi ko optical flow se track karta hai
+        self.GAZE_POINTS = np.concatenate(
+            [self.LEFT_IRIS, self.LEFT_EYE, self.RIGHT_IRIS, self.RIGHT_EYE]
+        )
+        # GAZE_POINTS subset ke andar har group ke indices
+        self._SUB_LEFT_IRIS = np.arange(0, 4)
+        self._SUB_LEFT_EYE = np.arange(4, 12)
+        self._SUB_RIGHT_IRIS = np.arange(12, 16)
+        self._SUB_RIGHT_EYE = np.arange(16, 24)
+        
+        # Preprocessing buffers - har frame pe naya image allocate nahi hoga
+        self.inference_width = inference_width
+        self._rgb_buf = None        # Mesh input (backend ke color order me, optional downscaled)
+        self._mesh_width = 0        # Pichle mesh input ki width (ROI gain ke liye)
+        self._gate_buf = None       # Gate ke liye downscaled BGR
+        self._gate_rgb_buf = None   # Gate input (RGB)
+        self._gate_bboxes = _NO_BBOXES  # Pichle gate ke face boxes - (K, 4) normalized x0, y0, x1, y1
+        
+        # Halka face detector - pehle faces gino, mesh baad me
+        self.face_gate = None
+        if use_face_gate:
+            import mediapipe as mp
+            self.face_gate = mp.solutions.face_detection.FaceDetection(
+                model_selection=FACE_GATE_MODEL,
+                min_detection_confidence=FACE_GATE_CONFIDENCE
+            )
+        self._gate_hold = 0          # Kitne aur frames gate bypass karna hai
+        self._frames_since_mesh = 0  # Last mesh run se kitne frames hue
+        self.mesh_runs = 0           # Kitni baar FaceMesh chala
+        self.gate_skips = 0          # Kitni baar gate ne mesh skip karwaya
+        
+        # ROI refinement - crop pe single-face backend (har crop alag face, isliye static mode)
+        self.roi_backend = None
+        if roi_refine:
+            self.roi_backend = create_backend(
+                self.backend.name, max_faces=1, static_image_mode=True, num_threads=num_threads
+            )
+        self._roi_buf = np.empty((ROI_SIZE, ROI_SIZE, 3), dtype=np.uint8)
+        self.roi_runs = 0       # Kitne crops pe refinement mesh chala
+        self.roi_refined = 0    # Kitne crops me face mila aur landmarks replace hue
+        
+        # Face tracker - stable IDs, primary user lock, cached gaze
+        self.tracker = FaceTracker() if use_tracker else None
+        
+        # Keyframe mode - beech ke frames me iris/eye points optical flow se
+        self.flow = LandmarkFlow(keyframe_interval) if keyframe_interval > 1 else None
+        self._keyframe_points = None  # Last mesh ke secondary faces ke gaze points (K, 24, 2)
+        self._keyframe_meta = None    # (face_count, observer ids) - flow frames isi ko report karte hain
+        
+        # Per-stage timers - Monitor apna StageTimings yaha set karta hai
+        self.timings = StageTimings(enabled=False)
+        self.verbose = True  # Har dekhne wale face ka print - batch audit me band
+    
+    def warm_up(self, shape=(480, 640, 3)):
+        """
+        Dummy frame pe ek inference - MediaPipe graph aur TFLite delegate abhi ban jayein
+        Pehle asli frame pe model load ka delay nahi lagega (counters/tracker nahi badalte)
+        """
+        dummy = np.zeros(shape, dtype=np.uint8)
+        self.backend.process(dummy)
+        if self.face_gate is not None:
+            self.face_gate.process(dummy)
+        if self.roi_backend is not None:
+            self.roi_backend.process(self._roi_buf)
+    
+    def _preprocess(self, frame):
+        """
+        BGR frame ko backend ke input me badlo - preallocated buffer me
+        inference_width set ho to pehle fixed-size buffer me downscale, phir in-place RGB
+        BGR backend (opencv_dnn) ko downscale na ho to frame seedha mil jata hai
+        """
+        h, w = frame.shape[:2]
+        self._mesh_width = w
+        to_rgb = self.backend.input_color == "rgb"
+        if self.inference_width and w > self.inference_width:
+            size = (self.inference_width, int(h * self.inference_width / w))
+            self._mesh_width = self.inference_width
+            self._rgb_buf = _reuse_buffer(self._rgb_buf, (size[1], size[0], 3))
+            cv2.resize(frame, size, dst=self._rgb_buf, interpolation=cv2.INTER_AREA)
+            if to_rgb:
+                cv2.cvtColor(self._rgb_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        elif to_rgb:
+            self._rgb_buf = _reuse_buffer(self._rgb_buf, frame.shape)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        else:
+            return frame
+        return self._rgb_buf
+    
+    def count_faces_fast(self, frame):
+        """
+        Downscaled frame pe halke face detector se faces gino
+        Boxes _gate_bboxes me rehte hain - mesh skip ho to tracker inhi se chalta hai
+        """
+        h, w = frame.shape[:2]
+        if w > FACE_GATE_WIDTH:
+            shape = (int(h * FACE_GATE_WIDTH / w), FACE_GATE_WIDTH, 3)
+            self._gate_buf = _reuse_buffer(self._gate_buf, shape)
+            cv2.resize(
+                frame, (shape[1], shape[0]), dst=self._gate_buf, interpolation=cv2.INTER_AREA
+            )
+            frame = self._gate_buf
+        self._gate_rgb_buf = _reuse_buffer(self._gate_rgb_buf, frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._gate_rgb_buf)
+        results = self.face_gate.process(self._gate_rgb_buf)
+        detections = results.detections or ()
+        self._gate_bboxes = np.array([
+            (box.xmin, box.ymin, box.xmin + box.width, box.ymin + box.height)
+            for box in (d.location_data.relative_bounding_box for d in detections)
+        ], dtype=np.float32).reshape(-1, 4)
+        return len(detections)
+    
+    def _should_run_mesh(self, frame):
+        """
+        Gate decision - mesh chalana hai ya nahi
+        Returns: (run_mesh, gate_face_count)
+        """
+        if self.face_gate is None:
+            return True, None
+        
+        # Abhi-abhi multiple faces dikhe the ya safety recheck ka time hai - mesh chalao
+        if self._gate_hold > 0 or self._frames_since_mesh >= FACE_GATE_RECHECK_FRAMES:
+            return True, None
+        
+        gate_count = self.count_faces_fast(frame)
+        return gate_count >= 2, gate_count
     
     def get_face_center(self, landmarks, frame_shape):
-        """Face ka center point nikalo - coordinates me"""
+        """Face ka center point nikalo - coordinates me (landmarks = (N, 3) array)"""
         h, w = frame_shape[:2]
-        # Sabhi landmarks ke x aur y coordinates nikalo
-        xs = [lm.x * w for lm in landmarks]
-        ys = [lm.y * h for lm in landmarks]
         # Average nikalo - yahi center hoga
-        return (np.mean(xs), np.mean(ys))
+        center = landmarks[:, :2].mean(axis=0)
+        return (float(center[0]) * w, float(center[1]) * h)
     
     def get_iris_position(self, landmarks, iris_indices, eye_indices, frame_shape):
         """Iris ki position nikalo eye ke andar - normalized (0 to 1)"""
-        h, w = frame_shape[:2]
-        
-        # Iris ka center calculate karo
-        iris_x = np.mean([landmarks[i].x for i in iris_indices])
-        iris_y = np.mean([landmarks[i].y for i in iris_indices])
-        
-        # Eye ki boundaries nikalo - left, right, top, bottom
-        eye_xs = [landmarks[i].x for i in eye_indices]
-        eye_ys = [landmarks[i].y for i in eye_indices]
-        
-        eye_left = min(eye_xs)
-        eye_right = max(eye_xs)
-        eye_top = min(eye_ys)
-        eye_bottom = max(eye_ys)
-        
-        # Iris position ko normalize karo (0 to 1, jaha 0.5 = center)
-        if eye_right - eye_left > 0:
-            norm_x = (iris_x - eye_left) / (eye_right - eye_left)
-        else:
-            norm_x = 0.5  # Default center
-            
-        if eye_bottom - eye_top > 0:
-            norm_y = (iris_y - eye_top) / (eye_bottom - eye_top)
-        else:
-            norm_y = 0.5  # Default center
-        
-        return norm_x, norm_y
+        # Single face ke liye bhi wahi vectorized math use karo
+        pos = iris_positions(landmarks[np.newaxis], iris_indices, eye_indices)[0]
+        return float(pos[0]), float(pos[1])
     
     def is_looking_at_camera(self, left_iris_pos, right_iris_pos):
         """
@@ -83,18 +248,20 @@ class FaceDetector:
         
         return is_centered
     
+    def get_face_bbox(self, landmarks, frame_shape):
+        """Face ka bounding box nikalo - (x_min, y_min, x_max, y_max) pixels me"""
+        h, w = frame_shape[:2]
+        xy = landmarks[:, :2]
+        lo = xy.min(axis=0)
+        hi = xy.max(axis=0)
+        return (float(lo[0]) * w, float(lo[1]) * h, float(hi[0]) * w, float(hi[1]) * h)
+    
     def get_face_size(self, landmarks, frame_shape):
         """Face ka size calculate karo - area me"""
-        h, w = frame_shape[:2]
-        xs = [lm.x * w for lm in landmarks]
-        ys = [lm.y * h for lm in landmarks]
-        
-        # Width aur height nikalo
-        width = max(xs) - min(xs)
-        height = max(ys) - min(ys)
+        x_min, y_min, x_max, y_max = self.get_face_bbox(landmarks, frame_shape)
         
         # Area return karo
-        return width * height
+        return (x_max - x_min) * (y_max - y_min)
     
     def analyze_frame(self, frame):
         """
@@ -103,110 +270,292 @@ class FaceDetector:
         YEH FUNCTION SABSE IMPORTANT HAI - yaha pe multi-face detection hota hai!
         
         Returns:
-            dict: {
-                "face_count": kitne faces hain,
-                "peeking": koi dekh raha hai ya nahi (True/False),
-                "confidence": kitna confident hain (0.0 to 1.0),
-                "reason": kyun detect hua ya nahi hua,
-            }
+            FrameResult: (read-only, results.py)
+                face_count = kitne faces hain,
+                peeking = koi dekh raha hai ya nahi (True/False),
+                confidence = kitna confident hain (0.0 to 1.0),
+                reason = kyun detect hua ya nahi hua,
+                observers = FaceObservation tuple (tracker on ho tab)
         """
         # Agar frame hi nahi hai to kya karenge
         if frame is None:
-            return {
-                "face_count": 0,
-                "peeking": False,
-                "confidence": 0.0,
-                "reason": "no_frame"
-            }
+            return NO_FRAME
+        
+        # Keyframe mode - mesh ke beech wale frames me sirf gaze points aage badhao
+        if self.flow is not None and self.flow.active:
+            with self.timings.stage("flow"):
+                result = self._propagate_gaze(frame)
+            if result is not None:
+                return result
+        
+        # Pehle sasta gate - 2 se kam faces hain to mesh ki zarurat hi nahi
+        with self.timings.stage("gate"):
+            run_mesh, gate_count = self._should_run_mesh(frame)
+        if not run_mesh:
+            if self.flow is not None:
+                self.flow.stop()
+            self.gate_skips += 1
+            self._frames_since_mesh += 1
+            if self.tracker is not None:
+                # Gate ke boxes se tracks match - primary lock skip frames pe bhi bana rahe
+                self.tracker.update(self._gate_bboxes)
+            return SINGLE_FACE if gate_count == 1 else NO_FACES
+        
+        # Backend ke color order me (MediaPipe = RGB) - reusable buffer me
+        with self.timings.stage("preprocess"):
+            mesh_input = self._preprocess(frame)
+        with self.timings.stage("facemesh"):
+            faces = self.backend.process(mesh_input)
+        self.mesh_runs += 1
+        self._frames_since_mesh = 0
+        
+        # Mesh ne 2+ faces dekhe to kuch frames gate bypass karo - timer flicker na kare
+        if len(faces) >= 2:
+            self._gate_hold = FACE_GATE_HOLD_FRAMES
+        elif self._gate_hold > 0:
+            self._gate_hold -= 1
         
-        # BGR se RGB me convert karo - MediaPipe ko RGB chahiye
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
+        # Landmarks se gaze decision - yaha per-face geometry hoti hai
+        self._keyframe_points = None  # 2+ faces mile to _evaluate_faces naye points bharega
+        with self.timings.stage("gaze"):
+            result = self._evaluate_faces(faces, frame)
         
+        # Keyframe record karo - agle frames flow se chalenge (sirf jab 2+ faces)
+        if self.flow is not None:
+            if self._keyframe_points is not None:
+                self.flow.start(frame, self._keyframe_points, self._keyframe_meta)
+            else:
+                self.flow.stop()
+        return result
+    
+    def analyze_batch(self, frames, timestamps=None, fps=None):
+        """
+        Bahut saare frames ek saath - columnar NumPy result (timestamp, face_count,
+        peeking, confidence). Details batch.analyze_batch me
+        """
+        from batch import analyze_batch
+        return analyze_batch(self, frames, timestamps=timestamps, fps=fps)
+    
+    def analyze_video(self, path, max_frames=None):
+        """Video file ka audit - decode background thread me, result columnar arrays"""
+        from batch import analyze_video
+        return analyze_video(self, path, max_frames=max_frames)
+    
+    def _propagate_gaze(self, frame):
+        """
+        Keyframe ke secondary faces ke gaze points optical flow se is frame tak lao
+        Tracking quality giri to None - caller full mesh chalayega
+        """
+        points = self.flow.propagate(frame)
+        if points is None:
+            return None
+        
+        left_positions = iris_positions(points, self._SUB_LEFT_IRIS, self._SUB_LEFT_EYE)
+        right_positions = iris_positions(points, self._SUB_RIGHT_IRIS, self._SUB_RIGHT_EYE)
+        
+        # Face count aur observer IDs keyframe wale hi rehte hain (bbox flow me track nahi hota)
+        face_count, observer_ids = self.flow.meta
+        left_list = left_positions.tolist()
+        right_list = right_positions.tolist()
+        observations = []
+        for row, observer_id in enumerate(observer_ids):
+            looking, confidence = self._gaze_from_positions(left_positions[row], right_positions[row])
+            observations.append(FaceObservation(
+                observer_id, looking, confidence,
+                left_iris=tuple(left_list[row]), right_iris=tuple(right_list[row]),
+            ))
+        return self._build_result(face_count, observations)
+    
+    def _refine_roi(self, frame, faces, indices):
+        """
+        Diye gaye faces ke landmarks native-resolution crop pe dobara nikalo - in-place
+        Downscaled mesh me door wale chhote faces ki iris detail kho jati hai
+        Crop me face na mile to coarse landmarks hi rehte hain
+        """
+        h, w = frame.shape[:2]
+        mesh_w = self._mesh_width
+        if w < mesh_w * ROI_MIN_GAIN:
+            return  # Mesh lagbhag native pe hi chala - refinement se kuch nahi milega
+        
+        for i in indices:
+            lo = faces[i, :, :2].min(axis=0)
+            hi = faces[i, :, :2].max(axis=0)
+            cx = (lo[0] + hi[0]) / 2 * w
+            cy = (lo[1] + hi[1]) / 2 * h
+            side = max((hi[0] - lo[0]) * w, (hi[1] - lo[1]) * h) * (1 + 2 * ROI_PADDING)
+            
+            # Mesh input me face pehle se bada tha - waha detail already kaafi hai
+            if side * mesh_w / w >= ROI_SIZE:
+                continue
+            
+            x0 = max(0, int(cx - side / 2))
+            y0 = max(0, int(cy - side / 2))
+            x1 = min(w, int(cx + side / 2) + 1)
+            y1 = min(h, int(cy + side / 2) + 1)
+            if x1 - x0 < 8 or y1 - y0 < 8:
+                continue
+            
+            crop_w = x1 - x0
+            crop_h = y1 - y0
+            cv2.resize(frame[y0:y1, x0:x1], (ROI_SIZE, ROI_SIZE), dst=self._roi_buf,
+                       interpolation=cv2.INTER_LINEAR)
+            if self.roi_backend.input_color == "rgb":
+                cv2.cvtColor(self._roi_buf, cv2.COLOR_BGR2RGB, dst=self._roi_buf)
+            self.roi_runs += 1
+            found = self.roi_backend.process(self._roi_buf)
+            if not len(found):
+                continue
+            
+            # Crop ke normalized coords wapas poore frame ke normalized coords me
+            refined = found[0]
+            n = len(refined)
+            faces[i, :n, 0] = (x0 + refined[:, 0] * crop_w) / w
+            faces[i, :n, 1] = (y0 + refined[:, 1] * crop_h) / h
+            faces[i, :n, 2] = refined[:, 2] * crop_w / w
+            self.roi_refined += 1
+    
+    def _evaluate_faces(self, faces, frame, facing=None):
+        """
+        Mesh ke landmarks se peeking decide karo - faces = backend ka (K, N, 3) array
+        Primary user (tracker ka locked face, ya sabse bada) ko chhod ke baaki faces ka gaze check
+        facing = optional (K,) bool - head pose se screen ki taraf nahi hai to iris check hi nahi
+        """
         # Agar koi face nahi mila
-        if not results.multi_face_landmarks:
-            return {
-                "face_count": 0,
-                "peeking": False,
-                "confidence": 0.0,
-                "reason": "no_faces"
-            }
+        if not len(faces):
+            if self.tracker is not None:
+                self.tracker.update(_NO_BBOXES)
+            return NO_FACES
         
         # Kitne faces detect hue
-        face_count = len(results.multi_face_landmarks)
+        face_count = len(faces)
         
         # Agar sirf ek face hai (user khud), to peeking possible nahi
-        if face_count == 1:
-            return {
-                "face_count": 1,
-                "peeking": False,
-                "confidence": 0.0,
-                "reason": "single_face"
-            }
+        if face_count == 1 and self.tracker is None:
+            return SINGLE_FACE
         
         # MULTI-FACE DETECTION - YEH SABSE IMPORTANT PART HAI!
         # Sabse bada face primary user hoga, baaki sab ko check karenge
         
-        face_data = []
-        for face_landmarks in results.multi_face_landmarks:
-            size = self.get_face_size(face_landmarks.landmark, frame.shape)
-            center = self.get_face_center(face_landmarks.landmark, frame.shape)
-            face_data.append({
-                'landmarks': face_landmarks.landmark,
-                'size': size,
-                'center': center
-            })
-        
-        # Size ke basis pe sort karo - sabse bada pehle
-        # Assumption: Sabse bada face = primary user (jo kaam kar raha hai)
-        face_data.sort(key=lambda x: x['size'], reverse=True)
-        
-        # Ab baaki ke faces check karo (index 1 se start - 0 to user hai)
+        # Sabhi faces ke bounding box ek saath - vectorized (normalized coords)
+        xy = faces[:, :, :2]
+        lo = xy.min(axis=1)
+        hi = xy.max(axis=1)
+        
+        if self.tracker is not None:
+            # Tracker stable IDs deta hai - primary user lock rehta hai, har frame re-sort nahi
+            tracks = self.tracker.update(np.concatenate([lo, hi], axis=1))
+            if face_count == 1:
+                return SINGLE_FACE
+            secondary = [i for i, t in enumerate(tracks) if t.id != self.tracker.primary_id]
+        else:
+            # Size ke basis pe sort karo - sabse bada pehle
+            # Assumption: Sabse bada face = primary user (jo kaam kar raha hai)
+            h, w = frame.shape[:2]
+            span = hi - lo
+            sizes = (span[:, 0] * w) * (span[:, 1] * h)
+            order = np.argsort(-sizes, kind="stable")
+            tracks = [None] * face_count
+            secondary = [int(i) for i in order[1:]]
+        
+        # Sirf un faces ka gaze nikalo jinka pose badla hai (ya jo tracked nahi hain)
+        turned_away = set() if facing is None else {i for i in secondary if not facing[i]}
+        fresh = [
+            i for i in secondary
+            if i not in turned_away
+            and (tracks[i] is None or not self.tracker.can_reuse_gaze(tracks[i]))
+        ]
+        if fresh and self.roi_backend is not None:
+            with self.timings.stage("roi"):
+                self._refine_roi(frame, faces, fresh)
+        if fresh:
+            left_positions = iris_positions(faces[fresh], self.LEFT_IRIS, self.LEFT_EYE)
+            right_positions = iris_positions(faces[fresh], self.RIGHT_IRIS, self.RIGHT_EYE)
+            left_list = left_positions.tolist()
+            right_list = right_positions.tolist()
+        fresh_rows = {face: row for row, face in enumerate(fresh)}
+        bbox_list = np.concatenate([lo, hi], axis=1).tolist()  # Observers ke liye plain floats
+        
+        # Ab baaki ke faces check karo - primary user ko chhod ke
+        observations = []
+        for rank, i in enumerate(secondary, start=2):
+            track = tracks[i]
+            left_iris = right_iris = None
+            if i in turned_away:
+                # Sir screen se mud gaya hai - dekh hi nahi sakta
+                looking, confidence = False, 0.0
+            elif i in fresh_rows:
+                # Is face ke iris positions - upar vectorized nikal chuke hain
+                row = fresh_rows[i]
+                looking, confidence = self._gaze_from_positions(
+                    left_positions[row], right_positions[row]
+                )
+                left_iris = tuple(left_list[row])
+                right_iris = tuple(right_list[row])
+                if track is not None:
+                    self.tracker.store_gaze(track, looking, confidence)
+            else:
+                # Pose same hai - pichla gaze result reuse karo
+                looking, confidence = self.tracker.reuse_gaze(track)
+            
+            observer_id = track.id if track is not None else rank
+            observations.append(FaceObservation(
+                observer_id, looking, confidence, bbox=tuple(bbox_list[i]),
+                left_iris=left_iris, right_iris=right_iris,
+                gaze_reused=i not in fresh_rows and i not in turned_away,
+            ))
+        
+        # Keyframe mode ke liye secondary faces ke gaze points yaad rakho
+        if self.flow is not None:
+            self._keyframe_points = faces[secondary][:, self.GAZE_POINTS, :2].copy()
+            self._keyframe_meta = (face_count, [o.id for o in observations])
+        
+        return self._build_result(face_count, observations)
+    
+    def _gaze_from_positions(self, left_iris_pos, right_iris_pos):
+        """Ek face ke iris positions se (looking, confidence)"""
+        # Check karo - kya yeh banda camera/screen ki taraf dekh raha hai?
+        looking = bool(self.is_looking_at_camera(left_iris_pos, right_iris_pos))
+        
+        # Confidence calculate karo - kitna centered hai gaze
+        avg_x = float(left_iris_pos[0] + right_iris_pos[0]) / 2
+        confidence = 1.0 - (abs(avg_x - 0.5) / GAZE_THRESHOLD_CENTER)
+        confidence = max(0.0, min(1.0, confidence))  # 0 se 1 ke beech me rakho
+        return looking, confidence
+    
+    def _build_result(self, face_count, observations):
+        """Secondary faces ke FaceObservation list se final FrameResult"""
         peeking_detected = False
         max_confidence = 0.0
         reason = None
         
-        # Har secondary face ko check karo
-        for i in range(1, len(face_data)):
-            landmarks = face_data[i]['landmarks']
-            
-            # Is face ke iris positions nikalo
-            left_iris_pos = self.get_iris_position(
-                landmarks, self.LEFT_IRIS, self.LEFT_EYE, frame.shape
-            )
-            right_iris_pos = self.get_iris_position(
-                landmarks, self.RIGHT_IRIS, self.RIGHT_EYE, frame.shape
-            )
-            
-            # Check karo - kya yeh banda camera/screen ki taraf dekh raha hai?
-            if self.is_looking_at_camera(left_iris_pos, right_iris_pos):
+        for observation in observations:
+            looking = observation.peeking
+            confidence = observation.confidence
+            if looking:
                 # HA! Koi dekh raha hai!
                 peeking_detected = True
                 
-                # Confidence calculate karo - kitna centered hai gaze
-                avg_x = (left_iris_pos[0] + right_iris_pos[0]) / 2
-                confidence = 1.0 - (abs(avg_x - 0.5) / GAZE_THRESHOLD_CENTER)
-                confidence = max(0.0, min(1.0, confidence))  # 0 se 1 ke beech me rakho
-                
                 # Sabse zyada confident detection save karo
                 if confidence > max_confidence:
                     max_confidence = confidence
                     reason = "gaze_at_screen"
                 
-                print(f"  → Face #{i+1}: DEKH RAHA HAI! Confidence: {confidence:.2f}")
+                if self.verbose:
+                    log.info("  → Face #%s: DEKH RAHA HAI! Confidence: %.2f", observation.id, confidence,
+                             extra=PER_FRAME)
         
         # Agar koi nahi dekh raha
         if not peeking_detected:
             reason = "multiple_faces_not_looking"
         
-        # Final result return karo
-        return {
-            "face_count": face_count,
-            "peeking": peeking_detected,
-            "confidence": max_confidence,
-            "reason": reason
-        }
+        # Final result return karo - stable IDs sirf tracker se (Monitor per-observer timers)
+        observers = tuple(observations) if self.tracker is not None else None
+        return FrameResult(face_count, peeking_detected, max_confidence, reason, observers)
     
     def cleanup(self):
         """Resources release karo - memory free karne ke liye"""
-        self.face_mesh.close()
\ No newline at end of file
+        self.backend.close()
+        if self.face_gate is not None:
+            self.face_gate.close()
+        if self.roi_backend is not None:
+            self.roi_backend.close()
\ No newline at end of file
@@ -0,0 +1,258 @@
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from app_logging import get_logger
+from results import NO_FRAME
+
+log = get_logger("detector_worker")
+
+# Configuration Constants - worker process settings
+RING_SLOTS = 3                    # Kitne frames ek saath flight me ho sakte hain
+MAX_FRAME_SHAPE = (1080, 1920, 3) # Sabse bada frame jo slot me aa sake (1080p BGR)
+STARTUP_TIMEOUT = 60.0            # Worker me MediaPipe load hone ka max wait (seconds)
+WORKER_POLL = 0.2                 # Worker ke har wait me itni der pe check - zinda hai?
+RESULT_TIMEOUT = 5.0              # Ek frame ke result ka max wait (seconds)
+WORKER_MAX_RESTARTS = 3           # Lagataar itni baar worker fail ho to haar maan lo (error upar)
+
+
+class WorkerError(Exception):
+    """Worker ke andar analyze_frame fail hua - message parent me wahi exception ban ke uthta hai"""
+
+
+def _worker_main(shm_name, slot_bytes, requests, results, detector_kwargs):
+    """
+    Worker process ka entry point - yaha FaceDetector chalta hai
+    Frames shared memory se padhta hai, sirf chhota FrameResult (fail ho to WorkerError) wapas bhejta hai
+    """
+    # Import yahi karo - parent process ko mediapipe ka bojh nahi uthana
+    from detector import FaceDetector
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    detector = FaceDetector(**detector_kwargs)
+    detector.warm_up()  # Ready bolne se pehle graph bana lo - pehla frame slow na ho
+    results.put(("ready", None, None))
+
+    try:
+        while True:
+            message = requests.get()
+            if message is None:
+                break  # Parent ne band karne bola
+
+            seq, slot, shape = message
+            # Shared memory ke slot pe seedha array view - koi copy/pickle nahi
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+            try:
+                result = detector.analyze_frame(frame)
+            except Exception as e:
+                # "No faces" bana ke mat chhupao - parent me raise hoga, Monitor band karke batayega
+                result = WorkerError(f"{type(e).__name__}: {e}")
+            del frame  # View chhodo warna shm.close() fail hoga
+            results.put((seq, slot, result))
+    finally:
+        detector.cleanup()
+        shm.close()
+
+
+class ProcessDetector:
+    """
+    FaceDetector jaisa interface, lekin inference alag process me chalta hai
+    Tk main loop aur detection GIL ke liye nahi ladte - UI smooth rehta hai
+    Frames shared memory ring slots se jaate hain, pickling sirf result dict ki hoti hai
+    Worker mar jaye ya atak jaye to naya worker start hota hai (frame drop, None result);
+    lagataar WORKER_MAX_RESTARTS baar fail ho to error caller tak jata hai
+    """
+    def __init__(self, slot_count=RING_SLOTS, max_frame_shape=MAX_FRAME_SHAPE, **detector_kwargs):
+        """Shared memory ring banao aur worker process start karo"""
+        self.slot_count = slot_count
+        self.slot_bytes = int(np.prod(max_frame_shape))
+        self.detector_kwargs = detector_kwargs
+
+        # spawn - Tk aur threads ke saath fork safe nahi hai
+        self._ctx = multiprocessing.get_context("spawn")
+        self.shm = shared_memory.SharedMemory(create=True, size=self.slot_bytes * slot_count)
+        self.process = None
+        self.restarts = 0     # Kitni baar worker dobara start hua
+        self._failures = 0    # Lagataar kitne frames pe worker fail hua
+
+        try:
+            self._start_worker()
+        except RuntimeError:
+            self.cleanup()
+            raise
+
+    def _start_worker(self):
+        """Naya worker process + queues, saare slots free - ready hone tak wait"""
+        self._requests = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._free_slots = list(range(self.slot_count))
+        self._next_seq = 0
+        self._ready_results = {}  # seq -> result, jo collect ho gaye par abhi maange nahi gaye
+
+        self.process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.shm.name, self.slot_bytes, self._requests, self._results,
+                  self.detector_kwargs),
+            daemon=True,
+        )
+        self.process.start()
+
+        # Worker ke ready hone ka wait karo - MediaPipe graph banne me time lagta hai.
+        # Beech me worker mar gaya (import/model error) to poora timeout mat ruko
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                self._results.get(timeout=WORKER_POLL)
+                return
+            except queue.Empty:
+                pass
+            if not self.process.is_alive():
+                raise RuntimeError(
+                    f"Detector worker process start hote hi band ho gaya "
+                    f"(exit code {self.process.exitcode})"
+                )
+            if time.monotonic() > deadline:
+                raise RuntimeError("Detector worker process start nahi hua")
+
+    def _stop_worker(self):
+        """Worker band karo - atka ho to terminate"""
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self._requests.put(None)
+            self.process.join(timeout=5.0)
+        self._kill_worker()
+
+    def _kill_worker(self):
+        """Worker abhi bhi zinda ho to terminate, phir bhi na mare to kill"""
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5.0)
+        self.process = None
+
+    def restart(self):
+        """
+        Mara/atka worker hatao aur naya lao - flight wale frames ke slots bhi free
+        (purana worker un slots ko ab kabhi nahi lautayega)
+        """
+        self._kill_worker()  # Atka hua hai - shutdown message nahi padhega
+        # Purani queues ka koi reader nahi bacha - exit pe unke feeder threads ka wait mat karo
+        for old_queue in (self._requests, self._results):
+            old_queue.cancel_join_thread()
+            old_queue.close()
+        self.restarts += 1
+        self._start_worker()
+
+    def submit(self, frame):
+        """
+        Frame ko free slot me copy karke worker ko bhejo
+        Returns: sequence number, ya None agar saare slots busy hain
+        """
+        if frame.dtype != np.uint8 or frame.nbytes > self.slot_bytes:
+            raise ValueError(
+                f"Frame slot me fit nahi hota: shape={frame.shape}, dtype={frame.dtype}"
+            )
+        if not self._free_slots:
+            return None
+
+        slot = self._free_slots.pop()
+        offset = slot * self.slot_bytes
+        view = np.ndarray(frame.shape, dtype=np.uint8, buffer=self.shm.buf, offset=offset)
+        np.copyto(view, frame)
+        del view
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._requests.put((seq, slot, frame.shape))
+        return seq
+
+    def collect(self, timeout=RESULT_TIMEOUT):
+        """Agla ready result lo - (seq, result)"""
+        if self._ready_results:
+            seq = min(self._ready_results)
+            result = self._ready_results.pop(seq)
+        else:
+            seq, result = self._receive(timeout)
+        if isinstance(result, WorkerError):
+            raise result
+        return seq, result
+
+    def _receive(self, timeout=RESULT_TIMEOUT):
+        """
+        Worker se agla result padho aur uska slot free karo
+        Chhote hisson me wait - worker beech me mar jaye to poora timeout nahi rukna
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                seq, slot, result = self._results.get(
+                    timeout=max(0.0, min(WORKER_POLL, deadline - time.monotonic()))
+                )
+                break
+            except queue.Empty:
+                pass
+            if not self.process.is_alive():
+                raise RuntimeError("Detector worker process band ho gaya")
+            if time.monotonic() >= deadline:
+                raise TimeoutError("Detector worker ne time pe result nahi diya")
+        self._free_slots.append(slot)
+        return seq, result
+
+    def analyze_frame(self, frame):
+        """
+        FaceDetector.analyze_frame jaisa synchronous call - worker ke result ka wait
+        Worker fail ho to restart karke None (frame drop - caller pichla result use kare)
+        """
+        if frame is None:
+            return NO_FRAME
+
+        try:
+            result = self._analyze(frame)
+        except (RuntimeError, TimeoutError) as e:
+            self._failures += 1
+            if self._failures > WORKER_MAX_RESTARTS:
+                raise
+            log.error("❌ Detector worker fail hua - %s. Naya worker start ho raha hai...", e)
+            self.restart()
+            return None
+        self._failures = 0
+        if isinstance(result, WorkerError):
+            raise result  # Worker zinda hai par analysis fail - restart se kuch nahi sudhrega
+        return result
+
+    def _analyze(self, frame):
+        """Frame bhejo aur usi frame ka result aane tak ruko"""
+        seq = self.submit(frame)
+        while seq is None:
+            # Ring full hai - pehle ek result nikaalo taaki slot free ho
+            done_seq, result = self._receive()
+            self._ready_results[done_seq] = result
+            seq = self.submit(frame)
+
+        while True:
+            if seq in self._ready_results:
+                return self._ready_results.pop(seq)
+            done_seq, result = self._receive()
+            if done_seq == seq:
+                return result
+            self._ready_results[done_seq] = result
+
+    def warm_up(self):
+        """Worker ready hone se pehle hi dummy inference kar chuka hai - kuch nahi karna"""
+
+    def cleanup(self):
+        """Worker band karo aur shared memory chhodo"""
+        self._stop_worker()
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,120 @@
+import time
+from collections import deque
+
+# Configuration Constants - Monitor -> UI events
+EVENT_POLL_MS = 30          # Tk thread itni der me queue drain karta hai
+EVENT_QUEUE_MAX = 256       # UI atak jaye to bhi queue isse lambi nahi hogi (purane drop)
+
+
+def _alert_key(event):
+    """Alert show/hide ek hi 'state' hain - sirf aakhri wala matter karta hai"""
+    return "alert" if "alert" in event else None
+
+
+class UIEventBus:
+    """
+    Worker threads se Tk main thread tak events - deque ke atomic append/popleft,
+    koi lock nahi, publish kabhi wait nahi karta
+    Tk thread root.after se drain karta hai; ek drain me same key ke events coalesce hote hain
+    (jaise show, hide, show -> sirf aakhri show)
+    Drain loop sirf start() se stop() tak chalta hai - monitoring band ho to Tk idle rehta hai
+    """
+    def __init__(self, root, dispatch, key=_alert_key, poll_ms=EVENT_POLL_MS,
+                 maxlen=EVENT_QUEUE_MAX):
+        """
+        root = Tk root (after ke liye), dispatch = Tk thread pe har event ka handler
+        key = event -> coalescing key (None = kabhi coalesce mat karo)
+        """
+        self.root = root
+        self.dispatch = dispatch
+        self.key = key
+        self.poll_ms = poll_ms
+        self._queue = deque(maxlen=maxlen)
+        self._after_id = None
+        self._running = False
+
+        self.published = 0       # Kitne events aaye (worker threads)
+        self.dispatched = 0      # Kitne handler tak pahunche
+        self.coalesced = 0       # Kitne naye event ke neeche dab gaye
+        self.max_depth = 0       # Drain ke time queue sabse lambi kitni thi
+        self._latency_total = 0.0    # Publish -> dispatch (seconds) - mean ke liye
+        self.latency_max = 0.0
+        self.latency_last = 0.0
+
+    def publish(self, event):
+        """Kisi bhi thread se - turant return, UI ka wait nahi"""
+        self._queue.append((time.perf_counter(), event))
+        self.published += 1
+
+    def start(self):
+        """Tk thread pe drain loop shuru karo - monitoring start hone pe"""
+        self._running = True
+        if self._after_id is None:
+            self._after_id = self.root.after(self.poll_ms, self._drain)
+
+    def stop(self):
+        """
+        Drain loop band karo - monitoring band hone pe (dispatch handler ke andar se bhi chalega)
+        Bache hue events chhod do - band monitoring ka purana alert agli baar nahi dikhna chahiye
+        """
+        self._running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._queue.clear()
+
+    def _drain(self):
+        """Tk thread - jitne events hain sab nikalo, coalesce karo, dispatch karo"""
+        self._after_id = None  # Yeh callback chal chuka
+        batch = []
+        depth = len(self._queue)
+        self.max_depth = max(self.max_depth, depth)
+        while True:
+            try:
+                batch.append(self._queue.popleft())
+            except IndexError:
+                break
+
+        # Har key ka sirf aakhri event rakho - order pehle occurrence ke hisaab se
+        pending = {}
+        order = []
+        for index, (published_at, event) in enumerate(batch):
+            key = self.key(event)
+            if key is None:
+                key = ("unique", index)
+            if key in pending:
+                self.coalesced += 1
+            else:
+                order.append(key)
+            pending[key] = (published_at, event)
+
+        for key in order:
+            published_at, event = pending[key]
+            latency = time.perf_counter() - published_at
+            self._latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.latency_last = latency
+            self.dispatched += 1
+            try:
+                self.dispatch(event)
+            except Exception as e:
+                print(f"⚠ Warning: UI event handle nahi hua - {e}")
+
+        # Dispatch me hi stop() hua ho (error pe monitoring band) to dobara mat lagao
+        if self._running and self._after_id is None:
+            self._after_id = self.root.after(self.poll_ms, self._drain)
+
+    def get_stats(self):
+        """Queue depth aur dispatch latency (ms)"""
+        return {
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "published": self.published,
+            "dispatched": self.dispatched,
+            "coalesced": self.coalesced,
+            "latency_mean_ms": (
+                1000.0 * self._latency_total / self.dispatched if self.dispatched else 0.0
+            ),
+            "latency_max_ms": 1000.0 * self.latency_max,
+            "latency_last_ms": 1000.0 * self.latency_last,
+        }
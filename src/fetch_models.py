@@ -0,0 +1,116 @@
+"""
+opencv_dnn backend ke models MODEL_DIR me laao, phir ek smoke check chalao
+
+YuNet face detector OpenCV Zoo se download hota hai. Landmark model ka URL/file khud dena
+padta hai - MediaPipe ka face_landmark_with_attention.tflite custom ops (transform_tensor_bilinear,
+transform_landmarks...) use karta hai, isliye tf2onnx se seedha ONNX nahi banta. Aisa export
+chahiye jisme woh ops standard ONNX ops se bane hon aur outputs ke naam wahi rahein
+(backends.DNN_LANDMARK_OUTPUTS). Jab tak aisa export nahi milta, opencv_dnn backends.BACKENDS
+me nahi hai - smoke check pass ho tabhi use register karo
+
+Examples:
+    python fetch_models.py --landmark-url https://.../face_landmark_with_attention.onnx
+    python fetch_models.py --landmark-file ~/Downloads/face_landmark_with_attention.onnx
+    python fetch_models.py --check --image face.jpg
+"""
+import argparse
+import os
+import shutil
+import sys
+import urllib.request
+
+import cv2
+import numpy as np
+
+from backends import (DNN_DETECTOR_MODEL, DNN_LANDMARK_MODEL, MODEL_DIR, NUM_LANDMARKS,
+                      OpenCVDNNBackend)
+
+# Configuration Constants - model downloads
+DETECTOR_URL = (
+    "https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/"
+    + DNN_DETECTOR_MODEL
+)
+DOWNLOAD_TIMEOUT = 60  # Seconds
+
+
+def download(url, path):
+    """URL se file - pehle .part me likho, poori aaye tabhi asli naam (adhoori file nahi bachti)"""
+    partial = path + ".part"
+    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, \
+            open(partial, "wb") as f:
+        shutil.copyfileobj(response, f)
+    os.replace(partial, path)
+
+
+def fetch(model_dir=MODEL_DIR, landmark_url=None, landmark_file=None, force=False):
+    """Jo models nahi hain woh laao - Returns: landmark model mila ya nahi"""
+    os.makedirs(model_dir, exist_ok=True)
+    detector_path = os.path.join(model_dir, DNN_DETECTOR_MODEL)
+    if force or not os.path.isfile(detector_path):
+        print(f"⬇ {DNN_DETECTOR_MODEL} download ho raha hai...")
+        download(DETECTOR_URL, detector_path)
+
+    landmark_path = os.path.join(model_dir, DNN_LANDMARK_MODEL)
+    if landmark_file:
+        shutil.copyfile(os.path.expanduser(landmark_file), landmark_path)
+    elif landmark_url and (force or not os.path.isfile(landmark_path)):
+        print(f"⬇ {DNN_LANDMARK_MODEL} download ho raha hai...")
+        download(landmark_url, landmark_path)
+
+    if not os.path.isfile(landmark_path):
+        print(f"⚠ Warning: {DNN_LANDMARK_MODEL} nahi hai - --landmark-url ya --landmark-file do")
+        return False
+    return True
+
+
+def smoke_check(model_dir=MODEL_DIR, image_path=None):
+    """
+    Backend banao (outputs ke naam yahi check ho jate hain), khaali frame pe 0 faces,
+    image di ho to kam se kam ek face ke 478 finite points chahiye
+    Returns: True agar sab theek
+    """
+    backend = OpenCVDNNBackend(model_dir=model_dir)
+    faces = backend.process(np.zeros((480, 640, 3), dtype=np.uint8))
+    if faces.shape != (0, NUM_LANDMARKS, 3):
+        print(f"❌ ERROR: Khaali frame pe faces mile: {faces.shape}")
+        return False
+
+    if image_path:
+        frame = cv2.imread(image_path)
+        if frame is None:
+            print(f"❌ ERROR: Image nahi khuli: {image_path}")
+            return False
+        faces = backend.process(frame)
+        if not len(faces) or not np.isfinite(faces).all():
+            print(f"❌ ERROR: {image_path} me face ke landmarks nahi mile")
+            return False
+        inside = ((faces[:, :, :2] >= 0) & (faces[:, :, :2] <= 1)).all(axis=2).mean()
+        print(f"✓ {len(faces)} face(s), {inside:.0%} points frame ke andar")
+
+    print("✓ opencv_dnn backend theek chal raha hai")
+    return True
+
+
+def main(argv=None):
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="opencv_dnn backend ke models")
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--landmark-url", help="Attention mesh ONNX export ka URL")
+    parser.add_argument("--landmark-file", help="Attention mesh ONNX export ki local file")
+    parser.add_argument("--force", action="store_true", help="Jo hain unhe bhi dobara download karo")
+    parser.add_argument("--check", action="store_true", help="Models ke baad smoke check chalao")
+    parser.add_argument("--image", help="Smoke check ke liye face wali image")
+    args = parser.parse_args(argv)
+
+    try:
+        ready = fetch(args.model_dir, args.landmark_url, args.landmark_file, args.force)
+    except OSError as e:
+        print(f"❌ ERROR: Model nahi aaya - {e}")
+        return 1
+    if args.check:
+        return 0 if ready and smoke_check(args.model_dir, args.image) else 1
+    return 0 if ready else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+import os
+import platform
+import time
+
+import cv2
+
+# Configuration Constants - webcam defaults
+CAMERA_WIDTH = 640        # Capture width
+CAMERA_HEIGHT = 480       # Capture height
+CAMERA_FPS = 30           # Camera se maanga gaya frame rate
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+# Har platform pe kaunse capture backends try karne hain - pehla jo khule woh use hoga
+PREFERRED_BACKENDS = {
+    "Windows": ["CAP_MSMF", "CAP_DSHOW"],
+    "Linux": ["CAP_V4L2"],
+    "Darwin": ["CAP_AVFOUNDATION"],
+}
+# V4L2 pe MJPG sasta padta hai - USB bandwidth kam, driver side pe YUYV conversion nahi
+PREFERRED_FOURCC = {
+    "CAP_V4L2": "MJPG",
+}
+
+
+def _fourcc_to_str(value):
+    """cv2 ka numeric FOURCC wapas 'MJPG' jaisa string banao"""
+    value = int(value)
+    if value <= 0:
+        return None
+    return "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4))
+
+
+class FrameSource:
+    """
+    Frame source interface - Monitor isi se frames leta hai
+    Subclasses open/grab/retrieve/release implement karte hain
+    """
+    name = "source"
+    live = True  # Live source (camera) hai ya finite (file/memory)
+
+    def __init__(self):
+        self.exhausted = False  # Finite source khatam ho gaya
+
+    def open(self):
+        """Source kholo - success pe True"""
+        raise NotImplementedError
+
+    def is_opened(self):
+        """Source khula hai ya nahi"""
+        raise NotImplementedError
+
+    def set_resolution(self, width, height):
+        """Chalte source ka resolution badlo - support na ho to False"""
+        return False
+
+    def grab(self):
+        """Agla frame lo bina decode kiye - False matlab frame nahi mila"""
+        raise NotImplementedError
+
+    def retrieve(self, image=None):
+        """
+        Last grab kiya hua frame decode karke do - (ret, frame)
+        image = preallocated buffer, source support kare to isi me decode hoga
+        """
+        raise NotImplementedError
+
+    def read(self, image=None):
+        """Grab + retrieve ek saath - (ret, frame)"""
+        if not self.grab():
+            return False, None
+        return self.retrieve(image)
+
+    def release(self):
+        """Resources chhodo"""
+
+    def describe(self):
+        """Source ki info - status/benchmark report ke liye"""
+        return {"type": self.name}
+
+    def frames(self):
+        """Saare frames generator ki tarah do - offline processing ke liye"""
+        if not self.is_opened() and not self.open():
+            raise IOError(f"Source nahi khula: {self.describe()}")
+        try:
+            while True:
+                ret, frame = self.read()
+                if not ret:
+                    if self.exhausted or self.live:
+                        break
+                    continue
+                yield frame
+        finally:
+            self.release()
+
+
+class WebcamSource(FrameSource):
+    """
+    Webcam source - backend, FOURCC aur resolution negotiate karta hai
+    Jo values camera ne sach me accept ki woh self.negotiated me milti hain
+    """
+    name = "webcam"
+
+    def __init__(self, index=0, width=CAMERA_WIDTH, height=CAMERA_HEIGHT, fps=CAMERA_FPS,
+                 backend=None, fourcc=None):
+        """backend = 'CAP_V4L2' jaisa naam, None = platform ke hisaab se try karo"""
+        super().__init__()
+        self.index = index
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.backend = backend
+        self.fourcc = fourcc
+        self.cap = None
+        self.negotiated = {}
+
+    def _candidate_backends(self):
+        """Kaunse backends try karne hain - aakhri option hamesha CAP_ANY"""
+        if self.backend:
+            names = [self.backend]
+        else:
+            names = PREFERRED_BACKENDS.get(platform.system(), [])
+        names = [n for n in names if hasattr(cv2, n)]
+        return names + ["CAP_ANY"]
+
+    def open(self):
+        """Pehla backend jo camera khol de use karo, phir format negotiate karo"""
+        for backend_name in self._candidate_backends():
+            cap = cv2.VideoCapture(self.index, getattr(cv2, backend_name))
+            if cap.isOpened():
+                self.cap = cap
+                self._negotiate(backend_name)
+                return True
+            cap.release()
+        return False
+
+    def _negotiate(self, backend_name):
+        """FOURCC, resolution aur fps set karo - camera ne jo diya woh record karo"""
+        fourcc = self.fourcc or PREFERRED_FOURCC.get(backend_name)
+        if fourcc:
+            # FOURCC pehle set karna padta hai - kuch drivers resolution ke baad ignore karte hain
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Driver ke andar purane frames mat rakho
+
+        self.negotiated = {
+            "backend": backend_name,
+            "fourcc": _fourcc_to_str(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            "width": int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": self.cap.get(cv2.CAP_PROP_FPS),
+        }
+
+    def set_resolution(self, width, height):
+        """
+        Chalte camera ka resolution badlo (capture thread se hi call karo)
+        Sirf is session ke liye - open() dobara configured width/height se khulega
+        """
+        if not self.is_opened():
+            return False
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.negotiated["width"] = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.negotiated["height"] = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return True
+
+    def is_opened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def grab(self):
+        return self.cap.grab()
+
+    def retrieve(self, image=None):
+        # Buffer diya hai to OpenCV usi me decode karta hai (shape match ho to)
+        if image is not None:
+            return self.cap.retrieve(image)
+        return self.cap.retrieve()
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def describe(self):
+        return {"type": self.name, "index": self.index, **self.negotiated}
+
+
+class VideoFileSource(FrameSource):
+    """
+    Video file source - replay/benchmark ke liye
+    pace=True pe file ke fps ke hisaab se frames deta hai (live camera jaisa)
+    """
+    name = "video"
+    live = False
+
+    def __init__(self, path, pace=False, loop=False):
+        super().__init__()
+        self.path = path
+        self.pace = pace
+        self.loop = loop
+        self.cap = None
+        self._interval = 0.0
+        self._next_time = 0.0
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            self.cap = None
+            return False
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self._interval = 1.0 / fps if fps and fps > 0 else 0.0
+        self._next_time = time.monotonic()
+        self.exhausted = False
+        return True
+
+    def is_opened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def grab(self):
+        if self.pace and self._interval:
+            # Real-time speed pe chalo - file ko camera ki tarah treat karo
+            delay = self._next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_time = max(self._next_time + self._interval, time.monotonic())
+
+        if self.cap.grab():
+            return True
+        if self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            return self.cap.grab()
+        self.exhausted = True
+        return False
+
+    def retrieve(self, image=None):
+        # Buffer diya hai to OpenCV usi me decode karta hai (shape match ho to)
+        if image is not None:
+            return self.cap.retrieve(image)
+        return self.cap.retrieve()
+
+    def position(self):
+        """Last grab kiye frame ka video timestamp (seconds)"""
+        return self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def describe(self):
+        return {"type": self.name, "path": self.path}
+
+
+class ImageSequenceSource(FrameSource):
+    """Image directory source - files naam ke order me, decode sirf retrieve pe"""
+    name = "images"
+    live = False
+
+    def __init__(self, directory, loop=False):
+        super().__init__()
+        self.directory = directory
+        self.loop = loop
+        self.paths = None
+        self._pos = -1
+
+    def open(self):
+        if not os.path.isdir(self.directory):
+            return False
+        self.paths = [
+            os.path.join(self.directory, name)
+            for name in sorted(os.listdir(self.directory))
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+        self._pos = -1
+        self.exhausted = False
+        return bool(self.paths)
+
+    def is_opened(self):
+        return bool(self.paths)
+
+    def grab(self):
+        self._pos += 1
+        if self._pos >= len(self.paths):
+            if not self.loop:
+                self.exhausted = True
+                return False
+            self._pos = 0
+        return True
+
+    def retrieve(self, image=None):
+        frame = cv2.imread(self.paths[self._pos])
+        return frame is not None, frame
+
+    def release(self):
+        self.paths = None
+
+    def describe(self):
+        return {"type": self.name, "path": self.directory}
+
+
+class MemorySource(FrameSource):
+    """
+    In-memory source - frames list ya generator se, bina hardware ke tests ke liye
+    fps diya ho to utni speed pe frames deta hai
+    """
+    name = "memory"
+    live = False
+
+    def __init__(self, frames, fps=None, loop=False):
+        super().__init__()
+        self._frames = frames
+        self.fps = fps
+        self.loop = loop
+        self._iter = None
+        self._current = None
+        self._next_time = 0.0
+
+    def open(self):
+        self._iter = iter(self._frames)
+        self._next_time = time.monotonic()
+        self.exhausted = False
+        return True
+
+    def is_opened(self):
+        return self._iter is not None
+
+    def grab(self):
+        if self.fps:
+            delay = self._next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_time = max(self._next_time + 1.0 / self.fps, time.monotonic())
+
+        try:
+            self._current = next(self._iter)
+        except StopIteration:
+            if not self.loop:
+                self.exhausted = True
+                return False
+            # Generator dobara nahi chalta - loop sirf list/tuple ke saath
+            self._iter = iter(self._frames)
+            try:
+                self._current = next(self._iter)
+            except StopIteration:
+                self.exhausted = True
+                return False
+        return True
+
+    def retrieve(self, image=None):
+        # Frames pehle se memory me hain - copy ki zarurat nahi
+        return self._current is not None, self._current
+
+    def release(self):
+        self._iter = None
+        self._current = None
@@ -0,0 +1,137 @@
+import time
+
+# Configuration Constants - CPU budget governor
+CPU_BUDGET = 0.10              # Ek core ka itna fraction (0.10 = ek core ka 10%)
+GOVERNOR_WINDOW_SECONDS = 2.0  # Itni der ka frame cost ek saath naap ke decision
+GOVERNOR_MIN_FPS = 5           # Budget me isse kam fps bache to resolution ghatao
+GOVERNOR_UPSHIFT_HEADROOM = 3  # Budget me MIN_FPS ka itna guna fps bache to resolution badhao
+GOVERNOR_HOLD_WINDOWS = 2      # Level badalne ke baad itne windows tak dobara mat badlo
+GOVERNOR_MAX_INTERVAL = 1.0    # Budget kitna bhi tight ho, frames ke beech isse zyada gap nahi
+
+# Quality levels - (capture scale, inference scale), configured resolution ke relative
+# Level 0 = jo configure kiya wahi; neeche jaate hue pehle mesh sasta, phir camera hi chhota
+GOVERNOR_LEVELS = (
+    (1.0, 1.0),    # Full detail
+    (1.0, 0.75),   # Mesh 3/4 width pe
+    (1.0, 0.5),    # Mesh aadhi width pe
+    (0.5, 1.0),    # Camera se hi aadha resolution - decode bhi sasta
+)
+
+
+class CpuGovernor:
+    """
+    CPU budget governor - ek analyzed frame ka kaam (decode + analyze + decision) naapta hai,
+    phir frame interval aur resolution level aise chunta hai ki budget me rahein
+    Frame interval har window pe set hota hai (cost / budget), resolution tab badalta hai
+    jab budget me GOVERNOR_MIN_FPS bhi na bache (ya kaafi headroom ho)
+    Cost sirf is frame ke kaam se aata hai, poore process ke CPU se nahi - warna frame
+    interval badhne pe baaki kharch kam frames me bant ke cost badha hua dikhata
+    (cpu_usage sirf report ke liye hai)
+    """
+    def __init__(self, budget=CPU_BUDGET, levels=GOVERNOR_LEVELS,
+                 window=GOVERNOR_WINDOW_SECONDS, min_fps=GOVERNOR_MIN_FPS,
+                 upshift_headroom=GOVERNOR_UPSHIFT_HEADROOM, hold_windows=GOVERNOR_HOLD_WINDOWS,
+                 max_interval=GOVERNOR_MAX_INTERVAL):
+        """budget = ek core ka fraction, levels = (capture scale, inference scale) list"""
+        self.budget = budget
+        self.levels = levels
+        self.window = window
+        self.min_fps = min_fps
+        self.upshift_headroom = upshift_headroom
+        self.hold_windows = hold_windows
+        self.max_interval = max_interval
+        self.reset()
+
+    def reset(self, now=None):
+        """Full quality level pe wapas - measurements bhi saaf"""
+        self.level = 0
+        self.min_interval = 0.0     # Frames ke beech kam se kam itna gap (seconds)
+        self.cpu_usage = 0.0        # Last window me poore process ka CPU (sirf report)
+        self.frame_cost = 0.0       # Last window me ek analyzed frame ka cost (seconds)
+        self.affordable_fps = None  # Budget me kitne fps chal sakte hain
+        self.level_changes = 0
+        self._hold = 0
+        self._start_window(time.monotonic() if now is None else now)
+
+    def _start_window(self, now):
+        """Naya measurement window"""
+        self._window_start = now
+        self._cpu_start = time.process_time()
+        self._frames = 0
+        self._busy = 0.0
+        self._capture_busy = 0.0  # Capture thread alag likhta hai - analysis wale se race nahi
+
+    def record_frame(self, seconds):
+        """Analysis thread - ek frame ka analyze + decision time (pool ka wait nahi)"""
+        self._frames += 1
+        self._busy += max(seconds, 0.0)  # Clock jitter se negative cost kabhi nahi
+
+    def record_capture(self, seconds):
+        """Capture thread - analysis ke liye maange gaye frame ka decode time"""
+        self._capture_busy += seconds
+
+    def update(self, now=None):
+        """
+        Window poora ho gaya ho to naye decisions lo
+        Returns: True agar resolution level badla (caller ko naya level apply karna hai)
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return False
+        if self._frames == 0:
+            self._start_window(now)
+            return False
+
+        self.cpu_usage = (time.process_time() - self._cpu_start) / elapsed
+        # Wall time - worker process (ProcessDetector) ka inference bhi isme aa jata hai
+        self.frame_cost = (self._busy + self._capture_busy) / self._frames
+        self.affordable_fps = self.budget / self.frame_cost if self.frame_cost > 0 else None
+        self.min_interval = min(self.frame_cost / self.budget, self.max_interval)
+
+        changed = False
+        if self._hold > 0:
+            self._hold -= 1
+        elif self.affordable_fps is not None and self.affordable_fps < self.min_fps:
+            changed = self._shift(1)
+        elif (
+            self.affordable_fps is None
+            or self.affordable_fps > self.min_fps * self.upshift_headroom
+        ):
+            changed = self._shift(-1)
+
+        self._start_window(now)
+        return changed
+
+    def _shift(self, step):
+        """Level ek step upar/neeche - range ke bahar na jaye"""
+        level = self.level + step
+        if not 0 <= level < len(self.levels):
+            return False
+        self.level = level
+        self.level_changes += 1
+        self._hold = self.hold_windows  # Naye level ka cost naapne do, phir sochna
+        return True
+
+    def level_config(self):
+        """Current level ka (capture scale, inference scale)"""
+        return self.levels[self.level]
+
+    def frame_interval(self):
+        """Budget ke hisaab se frames ke beech ka minimum gap (seconds)"""
+        return self.min_interval
+
+    def get_stats(self):
+        """Governor ke current decisions aur measurements"""
+        capture_scale, inference_scale = self.level_config()
+        return {
+            "budget_percent": 100.0 * self.budget,
+            "cpu_percent": 100.0 * self.cpu_usage,
+            "frame_cost_ms": 1000.0 * self.frame_cost,
+            "affordable_fps": self.affordable_fps,
+            "min_interval": self.min_interval,
+            "level": self.level,
+            "capture_scale": capture_scale,
+            "inference_scale": inference_scale,
+            "level_changes": self.level_changes,
+        }
@@ -0,0 +1,109 @@
+import threading
+
+import numpy as np
+
+# Configuration Constants - detection history
+HISTORY_SECONDS = 600       # Kitne minute ka history rakhna hai (10 min)
+HISTORY_FPS = 20            # Capacity ke hisaab ke liye max frame rate
+HISTORY_STAGES = ("motion", "analyze", "decision")  # Per-frame latency columns
+
+# Scalar columns - (naam, dtype)
+_COLUMNS = (
+    ("timestamp", np.float64),
+    ("face_count", np.int16),
+    ("peeking", np.bool_),
+    ("confidence", np.float32),
+    ("alert", np.bool_),        # Is frame ke baad alert active tha ya nahi
+    ("reused", np.bool_),       # Motion gate / busy pool - pichla result reuse hua
+    ("frame_age", np.float32),  # Capture se decision tak (seconds)
+)
+
+
+class DetectionHistory:
+    """
+    Fixed-capacity ring buffer - har frame ka result NumPy columns me
+    Append O(1) aur bina allocation, bhar jaye to sabse purani row overwrite
+    Lambi sessions me bhi memory fixed rehti hai; export pe chronological order
+    """
+    def __init__(self, seconds=HISTORY_SECONDS, fps=HISTORY_FPS, stages=HISTORY_STAGES):
+        self.capacity = int(seconds * fps)
+        self.stages = stages
+        self._columns = {name: np.zeros(self.capacity, dtype=dtype) for name, dtype in _COLUMNS}
+        # Latency (seconds) - ek row me saare stages
+        self._latency = np.zeros((self.capacity, len(stages)), dtype=np.float32)
+        self._lock = threading.Lock()  # Export UI thread se, append monitor thread se
+        self._pos = 0
+        self.size = 0
+        self.total = 0  # Kitni rows aayi (overwrite hui wali bhi)
+
+    def append(self, timestamp, result, alert, reused, frame_age, latencies):
+        """Ek frame jodo - latencies = stages ke order me seconds"""
+        with self._lock:
+            i = self._pos
+            columns = self._columns
+            columns["timestamp"][i] = timestamp
+            columns["face_count"][i] = result.face_count
+            columns["peeking"][i] = result.peeking
+            columns["confidence"][i] = result.confidence
+            columns["alert"][i] = alert
+            columns["reused"][i] = reused
+            columns["frame_age"][i] = frame_age
+            self._latency[i] = latencies
+            self._pos = (i + 1) % self.capacity
+            if self.size < self.capacity:
+                self.size += 1
+            self.total += 1
+
+    def clear(self):
+        """Sab rows hata do (buffers wahi rehte hain)"""
+        with self._lock:
+            self._pos = 0
+            self.size = 0
+            self.total = 0
+
+    def to_arrays(self):
+        """
+        {column: array} - purani se nayi row tak (copy)
+        Latency columns "<stage>_ms" naam se, milliseconds me
+        """
+        with self._lock:
+            start = (self._pos - self.size) % self.capacity
+            order = (start + np.arange(self.size)) % self.capacity
+            arrays = {name: column[order] for name, column in self._columns.items()}
+            latency = self._latency[order]
+        for index, stage in enumerate(self.stages):
+            arrays[f"{stage}_ms"] = latency[:, index] * 1000.0
+        return arrays
+
+    def save_npz(self, path):
+        """Compressed .npz - np.load(path) se wahi columns"""
+        np.savez_compressed(path, **self.to_arrays())
+
+    def save_csv(self, path):
+        """CSV - header me column naam, har frame ek line"""
+        arrays = self.to_arrays()
+        names = list(arrays)
+        table = np.column_stack([arrays[name].astype(np.float64) for name in names])
+        formats = ["%.6f" if arrays[name].dtype.kind == "f" else "%d" for name in names]
+        np.savetxt(path, table, fmt=formats, delimiter=",", header=",".join(names), comments="")
+
+    def save(self, path):
+        """Extension se format chuno - .npz ya .csv"""
+        if path.lower().endswith(".npz"):
+            self.save_npz(path)
+        elif path.lower().endswith(".csv"):
+            self.save_csv(path)
+        else:
+            raise ValueError(f"History export sirf .npz ya .csv me: {path}")
+
+    def get_stats(self):
+        """Kitni rows hain aur kitne seconds ka history hai"""
+        with self._lock:
+            if self.size == 0:
+                span = 0.0
+            else:
+                newest = self._columns["timestamp"][(self._pos - 1) % self.capacity]
+                oldest = self._columns["timestamp"][(self._pos - self.size) % self.capacity]
+                span = float(newest - oldest)
+        return {"size": self.size, "capacity": self.capacity, "total": self.total,
+                "seconds": span}
@@ -0,0 +1,109 @@
+import cv2
+import numpy as np
+
+# Configuration Constants - keyframe + optical flow settings
+KEYFRAME_INTERVAL = 1         # Har itne frames me full mesh (1 = flow band, har frame mesh)
+FLOW_WIN_SIZE = (15, 15)      # Lucas-Kanade search window
+FLOW_MAX_LEVEL = 2            # Pyramid levels - chhote faces ke liye 2 kaafi hai
+FLOW_MAX_ERROR = 15.0         # Median LK error isse zyada = tracking quality gir gayi
+FLOW_MIN_TRACKED = 0.9        # Itne fraction points track hone chahiye, warna keyframe
+FLOW_CRITERIA = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
+
+
+class LandmarkFlow:
+    """
+    Keyframe ke beech iris/eye points ko pyramidal Lucas-Kanade se propagate karo
+    Full mesh sirf keyframes pe, beech me sirf kuch points track hote hain
+    """
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL, max_error=FLOW_MAX_ERROR,
+                 min_tracked=FLOW_MIN_TRACKED):
+        self.keyframe_interval = keyframe_interval
+        self.max_error = max_error
+        self.min_tracked = min_tracked
+
+        self._prev_gray = None
+        self._gray = None
+        self._points = None       # (K * P, 1, 2) float32 pixel coords - LK ka format
+        self._shape = None        # (K, P) - faces aur points per face
+        self.meta = None          # Keyframe ki info (face_count, observer ids)
+        self._frames_since_keyframe = 0
+
+        self.keyframes = 0        # Kitne keyframes (full mesh) hue
+        self.propagated = 0       # Kitne frames flow se nikle
+        self.quality_drops = 0    # Kitni baar quality girne se jaldi keyframe
+
+    @property
+    def active(self):
+        """Flow state valid hai aur agle keyframe ka time nahi hua"""
+        return (
+            self._points is not None
+            and self._frames_since_keyframe < self.keyframe_interval - 1
+        )
+
+    def _to_gray(self, frame, out):
+        """BGR frame ko grayscale buffer me convert karo - buffer reuse"""
+        if out is None or out.shape != frame.shape[:2]:
+            out = np.empty(frame.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=out)
+        return out
+
+    def start(self, frame, points, meta):
+        """
+        Keyframe record karo - points (K, P, 2) normalized coords
+        meta = keyframe ka baaki result (face_count, observer ids)
+        """
+        self.keyframes += 1
+        h, w = frame.shape[:2]
+        self._prev_gray = self._to_gray(frame, self._prev_gray)
+        pixels = points * np.array([w, h], dtype=np.float32)
+        self._shape = points.shape[:2]
+        self._points = pixels.reshape(-1, 1, 2).astype(np.float32)
+        self.meta = meta
+        self._frames_since_keyframe = 0
+
+    def stop(self):
+        """Flow state chhodo - agla frame full mesh pe jayega"""
+        self._points = None
+        self.meta = None
+
+    def propagate(self, frame):
+        """
+        Points ko naye frame tak aage badhao
+        Returns: (K, P, 2) normalized points, ya None agar tracking quality giri
+        """
+        h, w = frame.shape[:2]
+        if (h, w) != self._prev_gray.shape:
+            # Beech me resolution badla (governor) - purane frame se flow nahi ho sakta
+            self.stop()
+            return None
+        self._gray = self._to_gray(frame, self._gray)
+        new_points, status, error = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, self._gray, self._points, None,
+            winSize=FLOW_WIN_SIZE, maxLevel=FLOW_MAX_LEVEL, criteria=FLOW_CRITERIA
+        )
+
+        tracked = status.ravel() == 1
+        if (
+            new_points is None
+            or tracked.mean() < self.min_tracked
+            or np.median(error.ravel()[tracked]) > self.max_error
+        ):
+            # Tracking bharosemand nahi - full mesh chalao
+            self.quality_drops += 1
+            self.stop()
+            return None
+
+        # Agle frame ke liye yahi reference - buffers swap karo, allocation nahi
+        self._prev_gray, self._gray = self._gray, self._prev_gray
+        self._points = new_points
+        self._frames_since_keyframe += 1
+        self.propagated += 1
+        return new_points.reshape(*self._shape, 2) / np.array([w, h], dtype=np.float32)
+
+    def get_stats(self):
+        """Keyframes vs propagated frames"""
+        return {
+            "keyframes": self.keyframes,
+            "propagated": self.propagated,
+            "quality_drops": self.quality_drops,
+        }
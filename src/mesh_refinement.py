@@ -0,0 +1,59 @@
+"""
+Attention mesh ke alag outputs (mesh, lips, eyes, irises) ko 478-point layout me jodna -
+MediaPipe ke LandmarksRefinementCalculator (tensors_to_face_landmarks_with_attention graph)
+jaisa. Index tables usi graph se hain
+"""
+import numpy as np
+
+# Mesh ke kis point ko refinement ka kaunsa point overwrite karega (refinement ke order me)
+_LIPS_INDICES = (
+    61, 146, 91, 181, 84, 17, 314, 405, 321, 375, 291, 185, 40, 39, 37, 0, 267, 269,
+    270, 409, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324, 308, 191, 80, 81, 82, 13,
+    312, 311, 310, 415, 76, 77, 90, 180, 85, 16, 315, 404, 320, 307, 306, 184, 74, 73,
+    72, 11, 302, 303, 304, 408, 62, 96, 89, 179, 86, 15, 316, 403, 319, 325, 292, 183,
+    42, 41, 38, 12, 268, 271, 272, 407,
+)
+_LEFT_EYE_INDICES = (
+    33, 7, 163, 144, 145, 153, 154, 155, 133, 246, 161, 160, 159, 158, 157, 173, 130,
+    25, 110, 24, 23, 22, 26, 112, 243, 247, 30, 29, 27, 28, 56, 190, 226, 31, 228, 229,
+    230, 231, 232, 233, 244, 113, 225, 224, 223, 222, 221, 189, 35, 124, 46, 53, 52, 65,
+    143, 111, 117, 118, 119, 120, 121, 128, 245, 156, 70, 63, 105, 66, 107, 55, 193,
+)
+_RIGHT_EYE_INDICES = (
+    263, 249, 390, 373, 374, 380, 381, 382, 362, 466, 388, 387, 386, 385, 384, 398, 359,
+    255, 339, 254, 253, 252, 256, 341, 463, 467, 260, 259, 257, 258, 286, 414, 446, 261,
+    448, 449, 450, 451, 452, 453, 464, 342, 445, 444, 443, 442, 441, 413, 265, 353, 276,
+    283, 282, 295, 372, 340, 346, 347, 348, 349, 350, 357, 465, 383, 300, 293, 334, 296,
+    336, 285, 417,
+)
+_LEFT_IRIS_INDICES = (468, 469, 470, 471, 472)
+_RIGHT_IRIS_INDICES = (473, 474, 475, 476, 477)
+
+# Iris ka z model nahi deta - aankh ke contour (pehle 16 eye points) ka average z lagta hai
+_LEFT_IRIS_Z_FROM = _LEFT_EYE_INDICES[:16]
+_RIGHT_IRIS_Z_FROM = _RIGHT_EYE_INDICES[:16]
+
+MESH_POINTS = 468
+
+_LIPS = np.array(_LIPS_INDICES, dtype=np.intp)
+_LEFT_EYE = np.array(_LEFT_EYE_INDICES, dtype=np.intp)
+_RIGHT_EYE = np.array(_RIGHT_EYE_INDICES, dtype=np.intp)
+_LEFT_IRIS = np.array(_LEFT_IRIS_INDICES, dtype=np.intp)
+_RIGHT_IRIS = np.array(_RIGHT_IRIS_INDICES, dtype=np.intp)
+_LEFT_IRIS_Z = np.array(_LEFT_IRIS_Z_FROM, dtype=np.intp)
+_RIGHT_IRIS_Z = np.array(_RIGHT_IRIS_Z_FROM, dtype=np.intp)
+
+
+def refine_landmarks(out, mesh, lips, left_eye, right_eye, left_iris, right_iris):
+    """
+    out = (478, 3) buffer. mesh = 468*3 values (x, y, z), baaki sab 2D (x, y) flat arrays
+    Lips/eyes sirf x, y overwrite karte hain (z mesh wala), irises ka z eye contour ka average
+    """
+    out[:MESH_POINTS] = np.reshape(mesh, (MESH_POINTS, 3))
+    out[MESH_POINTS:] = 0.0
+    for indices, values in ((_LIPS, lips), (_LEFT_EYE, left_eye), (_RIGHT_EYE, right_eye),
+                            (_LEFT_IRIS, left_iris), (_RIGHT_IRIS, right_iris)):
+        out[indices, :2] = np.reshape(values, (len(indices), 2))
+    out[_LEFT_IRIS, 2] = out[_LEFT_IRIS_Z, 2].mean()
+    out[_RIGHT_IRIS, 2] = out[_RIGHT_IRIS_Z, 2].mean()
+    return out
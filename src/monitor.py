@@ -1,29 +1,221 @@
-import cv2
 import time
 import threading
-from detector import FaceDetector
+from app_logging import PER_FRAME, get_logger
+from async_stream import AsyncStream
+from frame_source import WebcamSource
+from governor import CpuGovernor
+from history import DetectionHistory
+from motion_gate import MotionGate
+from results import FaceObservation
+from scheduler import FrameScheduler
+from timing import StageTimings, TIMING_ENABLED
+
+log = get_logger("monitor")
 
 # Configuration Constants - settings yaha adjust kar sakte ho
 REQUIRED_SECONDS = 5  # Kitne seconds tak dekhna chahiye alert ke liye
-FPS_EST = 20          # Target frame rate - performance ke liye
+FPS_EST = 20          # Full frame rate - jab peeking ka shak ho (alert-pending)
+MOTION_GATE_ENABLED = True  # Static scene pe FaceMesh skip karo, pichla result reuse
+CPU_GOVERNOR_ENABLED = False  # CPU budget (governor.CPU_BUDGET) me rehne ke liye fps/resolution ghatao
+HISTORY_ENABLED = True      # Har frame ka result ring buffer me (last history.HISTORY_SECONDS)
+USE_PROCESS_WORKER = False  # True = detection alag process me (UI ke GIL se door)
+USE_ASYNC_DETECTOR = False  # True = MediaPipe Tasks FaceLandmarker LIVE_STREAM (models/face_landmarker.task)
+MULTI_RES_ENABLED = False   # High-res capture, chhote frame pe detection, door ke faces native crop pe
+MULTI_RES_CAPTURE = (1920, 1080)  # Multi-res mode me camera se itna maango
+MULTI_RES_INFERENCE_WIDTH = 640   # Multi-res mode me poore frame ka mesh is width pe
+FRAME_WAIT_TIMEOUT = 0.5  # Naye frame ka kitna wait karein (seconds) - stop check ke liye
+OBSERVER_GRACE_SECONDS = 0.5  # Observer frame se itni der gayab rahe tab bhi uska timer chalu
+FRAME_POOL_SIZE = 3       # Reusable frame buffers - published + consumer ke paas + producer likh raha
+
+# Tracker na ho to poora frame ek observer - har frame naya object banane ki jagah yeh do
+_WHOLE_FRAME_PEEKING = (FaceObservation(None, True),)
+_WHOLE_FRAME_IDLE = (FaceObservation(None, False),)
+
+
+class LatestFrameSlot:
+    """
+    Single-slot frame buffer - capture thread likhta hai, analysis thread padhta hai
+    Sirf sabse naya frame rakha jata hai, purane frames drop ho jate hain
+    
+    Frames ek chhote buffer pool me rehte hain aur reuse hote hain - har frame pe
+    naya array allocate nahi hota. get() se mila frame agle get() tak valid hai.
+    """
+    def __init__(self, pool_size=FRAME_POOL_SIZE):
+        self._cond = threading.Condition()
+        self._pool = [None] * pool_size  # Reusable frame arrays (pehle write pe allocate)
+        self._latest = None    # Published (abhi tak na padha gaya) frame ka pool index
+        self._reading = None   # Consumer ke paas jo frame hai uska pool index
+        self._timestamp = 0.0
+        self._waiters = 0        # Kitne consumers abhi frame ka wait kar rahe hain
+        self.frames_written = 0  # Kitne frames capture hue
+        self.frames_dropped = 0  # Kitne frames bina analyze hue overwrite ho gaye
+    
+    def acquire_buffer(self):
+        """
+        Producer ke liye free buffer - (index, array ya None)
+        Yeh buffer na published hai na consumer ke paas, isme safely likh sakte hain
+        """
+        with self._cond:
+            for index, buffer in enumerate(self._pool):
+                if index != self._latest and index != self._reading:
+                    return index, buffer
+        raise RuntimeError("Frame pool me koi free buffer nahi")
+    
+    def put(self, frame, timestamp, index):
+        """
+        acquire_buffer() wale index pe naya frame publish karo
+        Agar purana padha nahi gaya to woh drop
+        """
+        with self._cond:
+            if self._latest is not None:
+                self.frames_dropped += 1
+            # Source ne naya array diya ho (jaise resolution badla) to pool me wahi rakho
+            self._pool[index] = frame
+            self._latest = index
+            self._timestamp = timestamp
+            self.frames_written += 1
+            self._cond.notify_all()  # Consumer jage (producer yaha wait nahi kar raha hota)
+    
+    def get(self, timeout=None):
+        """
+        Sabse naya frame lo - (frame, capture_timestamp)
+        Timeout tak koi frame na aaye to (None, 0.0)
+        """
+        with self._cond:
+            if self._latest is None:
+                self._waiters += 1
+                self._cond.notify_all()  # wait_for_consumer() wala producer jage
+                try:
+                    self._cond.wait(timeout)
+                finally:
+                    self._waiters -= 1
+            if self._latest is None:
+                return None, 0.0
+            # Pichla frame ab free - naya frame consumer ke paas
+            self._reading = self._latest
+            self._latest = None
+            return self._pool[self._reading], self._timestamp
+    
+    def has_waiter(self):
+        """Koi consumer abhi frame ka wait kar raha hai ya nahi"""
+        return self._waiters > 0
+    
+    def wait_for_consumer(self, timeout=None):
+        """
+        Producer - tab tak ruko jab tak consumer pichla frame le chuka ho aur naye ka wait
+        kar raha ho (finite sources ke liye - koi frame drop nahi hota)
+        Returns: False agar timeout ho gaya
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._waiters > 0 and self._latest is None, timeout
+            )
+    
+    def clear(self):
+        """Slot khali karo - restart ke time purana frame na mile"""
+        with self._cond:
+            self._latest = None
+            self._reading = None
+            self.frames_written = 0
+            self.frames_dropped = 0
+
 
 class Monitor:
-    def __init__(self, webcam_index=0, required_seconds=REQUIRED_SECONDS):
-        """Monitor initialize karo - webcam monitoring ke liye"""
+    def __init__(self, webcam_index=0, required_seconds=REQUIRED_SECONDS, scheduler=None,
+                 detector=None, source=None, use_process_worker=USE_PROCESS_WORKER,
+                 timing=TIMING_ENABLED, motion_gate=MOTION_GATE_ENABLED,
+                 multi_res=MULTI_RES_ENABLED, governor=CPU_GOVERNOR_ENABLED,
+                 history=HISTORY_ENABLED, use_async_detector=USE_ASYNC_DETECTOR):
+        """
+        Monitor initialize karo - webcam monitoring ke liye
+        source = koi bhi FrameSource (webcam, video file, images, memory)
+        Na diya ho to webcam_index wala WebcamSource banega
+        use_process_worker = inference alag process me chalao (shared memory frames)
+        timing = har stage (capture, FaceMesh, gaze, callback...) ka timing histogram rakho
+        motion_gate = True/False ya apna MotionGate - frame na badle to inference skip
+        multi_res = high-res capture + downscaled mesh + secondary faces ka native ROI refinement
+        governor = True/False ya apna CpuGovernor - CPU budget ke hisaab se frame interval,
+                   capture aur inference resolution
+        history = True/False ya apna DetectionHistory - har frame ka result, export_history() se file
+        use_async_detector = AsyncFaceDetector - inference MediaPipe ke thread pe, result callback
+                             se decision; analysis thread kabhi inference ka wait nahi karta
+        """
         self.webcam_index = webcam_index
         self.required_seconds = required_seconds
         self.is_running = False
-        self.thread = None
+        self.error = None           # Detector fail hua to uska message (monitoring band)
+        self.thread = None          # Analysis thread
+        self.capture_thread = None  # Webcam capture thread
         self.callback = None  # Alert bhejne ke liye callback function
+        self.event_stream = AsyncStream()   # events() subscribers - alert on/off
+        self.result_stream = AsyncStream()  # results() subscribers - har decision ka FrameResult
+        
+        # Face detector initialize karo - bahar se diya ho to wahi use karo
+        if detector is None:
+            # MediaPipe import bhaari hai - sirf tab jab apna detector banana ho
+            from detector import FaceDetector
+            from detector_worker import ProcessDetector
+            detector_kwargs = {}
+            if multi_res:
+                detector_kwargs = {"inference_width": MULTI_RES_INFERENCE_WIDTH, "roi_refine": True}
+            if use_async_detector:
+                from async_detector import AsyncFaceDetector
+                detector = AsyncFaceDetector(inference_width=detector_kwargs.get("inference_width"))
+            elif use_process_worker:
+                detector = ProcessDetector(**detector_kwargs)
+            else:
+                detector = FaceDetector(**detector_kwargs)
+        self.detector = detector
+        # Async detector - frames submit hote hain, decision result callback pe
+        self.asynchronous = getattr(detector, "asynchronous", False)
+        if self.asynchronous:
+            detector.register_result_callback(self._on_async_result)
+        self._decision_lock = threading.Lock()  # Async callback aur analysis thread dono decide karte hain
+        
+        # Per-stage timers - detector bhi isi me record karta hai
+        self.timings = StageTimings(enabled=timing)
+        self.detector.timings = self.timings
+        if source is None:
+            if multi_res:
+                width, height = MULTI_RES_CAPTURE
+                source = WebcamSource(webcam_index, width=width, height=height)
+            else:
+                source = WebcamSource(webcam_index)
+        self.source = source  # Frames kaha se aayenge
+        self.frame_slot = LatestFrameSlot()  # Capture aur analysis ke beech latest frame
         
-        # Face detector initialize karo
-        self.detector = FaceDetector()
-        self.cap = None  # Webcam capture object
+        # Motion gate - scene static ho to pichla result reuse
+        if motion_gate is True:
+            motion_gate = MotionGate()
+        self.motion_gate = motion_gate or None
+        self.last_result = None  # Pichla analyze_frame result - motion gate isko reuse karta hai
+        
+        # Adaptive frame rate - idle me dheere, peeking ke shak pe full rate
+        self.scheduler = scheduler or FrameScheduler(pending_fps=FPS_EST)
+        
+        # CPU governor - scheduler ke upar budget ki limit, zarurat pe resolution bhi kam
+        if governor is True:
+            governor = CpuGovernor()
+        self.governor = governor or None
+        self._base_inference_width = getattr(self.detector, "inference_width", None)
+        self._base_frame_size = None   # Session ke pehle frame ka (width, height) - level 0
+        self._capture_scale = 1.0      # Governor ne jo capture scale maanga
+        self._applied_capture_scale = 1.0  # Capture thread ne jo lagaya
+        
+        # Detection history - false alerts / throughput baad me dekhne ke liye
+        if history is True:
+            history = DetectionHistory()
+        self.history = history or None
         
         # State tracking variables - kon kab dekh raha hai track karne ke liye
-        self.peeking_start_time = None  # Jab peeking start hui
+        self.peeking_start_time = None  # Jab peeking start hui (sabse purana observer timer)
+        self.observer_timers = {}       # observer_id -> [start_time, last_seen_time]
         self.alert_active = False        # Alert abhi active hai ya nahi
         self.last_frame_time = time.time()
+        self.last_frame_age = 0.0  # Decision ke time frame kitna purana tha (seconds)
+        self.avg_frame_age = 0.0   # Frame age ka moving average
+        self.started_at = None           # start() kab hua (time.time())
+        self.first_frame_latency = None  # start() se pehle analyzed frame tak (seconds)
         
     def register_callback(self, callback):
         """
@@ -32,12 +224,63 @@ class Monitor:
         """
         self.callback = callback
     
+    def events(self, maxlen=None):
+        """
+        asyncio se alerts: async for event in monitor.events() - stop() pe khatam
+        Har subscriber ki apni bounded queue (maxlen), consumer slow ho to purane events drop
+        """
+        return self.event_stream.subscribe(maxlen)
+    
+    def results(self, maxlen=None):
+        """async for result in monitor.results() - har decision ka FrameResult (read-only)"""
+        return self.result_stream.subscribe(maxlen)
+    
+    def _emit(self, event):
+        """Alert event - callback (worker thread pe) aur async subscribers dono ko"""
+        if self.callback:
+            with self.timings.stage("callback"):
+                self.callback(event)
+        self.event_stream.publish(event)
+    
+    def warm_up(self):
+        """
+        Detector ka model abhi load + ek dummy inference - Activate pe delay na ho
+        Background thread se call karo, UI block nahi hoga
+        """
+        warm_up = getattr(self.detector, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
+    
     def start(self):
         """Monitoring start karo - separate thread me chalega"""
         if self.is_running:
             return False  # Agar pehle se chal raha hai to dobara start mat karo
         
         self.is_running = True
+        self.error = None
+        self.started_at = time.time()
+        self.first_frame_latency = None
+        self.frame_slot.clear()
+        self.scheduler.reset()
+        self.timings.reset()
+        if self.history is not None:
+            self.history.clear()
+        self.last_result = None
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+        if self.governor is not None:
+            # Source configured resolution pe dobara khulega - governor bhi full quality se
+            self.governor.reset()
+            self._base_frame_size = None
+            self._capture_scale = self._applied_capture_scale = 1.0
+            if hasattr(self.detector, "inference_width"):
+                self.detector.inference_width = self._base_inference_width
+        tracker = getattr(self.detector, "tracker", None)
+        if tracker is not None:
+            tracker.reset()  # Purane session ke face IDs mat rakho
+        # Capture aur analysis alag threads me - camera blocking aur inference overlap honge
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
         # Separate thread me run karo - UI block nahi hoga
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
@@ -48,120 +291,376 @@ class Monitor:
         self.is_running = False
         if self.thread:
             self.thread.join(timeout=2.0)  # Thread ke end hone ka wait karo
+        if self.capture_thread:
+            self.capture_thread.join(timeout=2.0)
         
-        # Webcam release karo
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        # Source (webcam/file) release karo
+        self.source.release()
+        
+        # Async subscribers ke iterators khatam (bache items pehle mil jayenge)
+        self.event_stream.close()
+        self.result_stream.close()
         
         # State reset karo
         self.peeking_start_time = None
+        self.observer_timers = {}
         self.alert_active = False
+        self.last_frame_age = 0.0
+        self.avg_frame_age = 0.0
     
-    def _monitor_loop(self):
+    def _capture_loop(self):
         """
-        Main monitoring loop - yaha sabse important kaam hota hai
-        Continuously frames capture karta hai aur analyze karta hai
+        Capture loop - webcam se frames padhta hai aur latest slot me daalta hai
+        Live source pe analysis ka wait nahi karta, isliye camera ka buffer back up nahi hota.
+        File/memory source (live = False) pe grab se pehle analysis thread ka wait - har frame
+        analyze hota hai, warna capture poora source analysis ke jaagne se pehle hi padh leta
         """
-        # Webcam initialize karo
-        self.cap = cv2.VideoCapture(self.webcam_index)
-        
-        if not self.cap.isOpened():
-            print("❌ ERROR: Webcam nahi khula. Check karo camera connected hai.")
+        # Source kholo - webcam ho to backend/format negotiation yahi hota hai
+        if not self.source.open():
+            log.error("❌ ERROR: Source (%s) nahi khula. Check karo camera connected hai.", self.source.name)
             self.is_running = False
             return
         
-        # Camera properties set karo - better performance ke liye
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)   # Width
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)  # Height
-        self.cap.set(cv2.CAP_PROP_FPS, 30)            # Frame rate
-        
-        print("✓ Monitor start ho gaya - webcam active hai")
+        log.info("✓ Monitor start ho gaya - source active hai: %s", self.source.describe())
         
-        # Infinite loop - jab tak monitoring on hai
         while self.is_running:
-            # Frame capture karo
-            ret, frame = self.cap.read()
+            if not self.source.live and not self.frame_slot.wait_for_consumer(FRAME_WAIT_TIMEOUT):
+                continue  # Analysis abhi pichla frame kar raha hai - is_running dobara check karo
             
-            if not ret:
-                print("⚠ Warning: Frame capture nahi hua")
+            # Frame grab karo - driver ka buffer khali rehta hai, decode abhi nahi
+            with self.timings.stage("grab"):
+                grabbed = self.source.grab()
+            if not grabbed:
+                if self.source.exhausted:
+                    # File/memory source khatam - monitoring band
+                    log.info("✓ Source ke saare frames ho gaye")
+                    self.is_running = False
+                    break
+                log.warning("⚠ Warning: Frame capture nahi hua", extra=PER_FRAME)
                 time.sleep(0.1)
                 continue
+            captured_at = time.time()  # Exposure ka waqt grab pe hai - decode/wait baad me
             
-            # Frame ko analyze karo - detector se
-            result = self.detector.analyze_frame(frame)
+            # Governor ne capture resolution badla ho to yahi lagao - cap sirf is thread ka hai
+            if self._capture_scale != self._applied_capture_scale:
+                self._apply_capture_scale()
             
-            current_time = time.time()
+            # Sirf tab decode karo jab analysis thread ko frame chahiye - har state me.
+            # Grab chalta rehta hai (driver buffer khali), decode ka kharch analyzed frames jitna
+            if not self.frame_slot.has_waiter():
+                continue
             
-            # PEEKING DETECTION LOGIC - yeh core logic hai!
-            if result["peeking"]:
-                # Koi dekh raha hai screen ko!
-                
-                if self.peeking_start_time is None:
-                    # Pehli baar dekha - timer start karo
-                    self.peeking_start_time = current_time
-                    print(f"👀 Peeking shuru hui! ({result['face_count']} faces detected)")
-                
-                # Kitne der se dekh raha hai calculate karo
-                peeking_duration = current_time - self.peeking_start_time
-                
-                # Agar required seconds se zyada time ho gaya
-                if peeking_duration >= self.required_seconds and not self.alert_active:
-                    # ALERT TRIGGER KARO!
-                    self.alert_active = True
-                    print(f"🚨 ALERT! Peeking {peeking_duration:.1f} seconds se ho rahi hai!")
-                    
-                    # Callback call karo - UI ko batao alert dikhane ke liye
-                    if self.callback:
-                        self.callback({"alert": True, "duration": peeking_duration})
+            # Free pool buffer me hi decode karo - naya array allocate nahi hoga
+            index, buffer = self.frame_slot.acquire_buffer()
+            decode_start = time.perf_counter()
+            with self.timings.stage("decode"):
+                ret, frame = self.source.retrieve(buffer)
+            if self.governor is not None:
+                self.governor.record_capture(time.perf_counter() - decode_start)
+            if not ret:
+                log.warning("⚠ Warning: Frame decode nahi hua", extra=PER_FRAME)
+                continue
             
-            else:
-                # Peeking nahi ho rahi - koi nahi dekh raha ya sirf ek face hai
-                
-                if self.peeking_start_time is not None:
-                    # Peeking ruk gayi
-                    peeking_duration = current_time - self.peeking_start_time
-                    print(f"✓ Peeking band ho gayi ({peeking_duration:.1f}s ke baad)")
-                
-                # Timer reset karo
-                self.peeking_start_time = None
-                
-                if self.alert_active:
-                    # Alert deactivate karo
-                    self.alert_active = False
-                    print("✓ Alert deactivate - ab safe hai")
-                    
-                    # Callback call karo - UI ko batao alert band karne ke liye
-                    if self.callback:
-                        self.callback({"alert": False})
-            
-            # Frame rate control - CPU ko overload mat karo
+            # Latest slot me daalo - purana frame (agar padha nahi gaya) drop ho jayega
+            self.frame_slot.put(frame, captured_at, index)
+        
+        # Loop end hone pe source release karo
+        self.source.release()
+    
+    def _monitor_loop(self):
+        """
+        Main monitoring loop - yaha sabse important kaam hota hai
+        Latest slot se sabse naya frame leta hai aur analyze karta hai
+        """
+        # Infinite loop - jab tak monitoring on hai
+        while self.is_running:
+            # Sabse naya frame lo - capture thread se
+            frame, captured_at = self.frame_slot.get(timeout=FRAME_WAIT_TIMEOUT)
+            
+            if frame is None:
+                continue  # Abhi frame nahi aaya - is_running dobara check karo
+            frame_start = time.perf_counter()
+            if self._base_frame_size is None:
+                self._base_frame_size = (frame.shape[1], frame.shape[0])
+            
+            # Motion gate - scene nahi badla to FaceMesh ki zarurat nahi
+            process = True
+            if self.motion_gate is not None:
+                with self.timings.stage("motion"):
+                    process = self.motion_gate.should_process(frame, captured_at)
+                process = process or self.last_result is None
+            motion_done = time.perf_counter()
+            pool_wait = 0.0  # Sirf isi iteration ke analyze_frame ka shared pool wait
+            
+            try:
+                if self.asynchronous:
+                    # Async detector - frame bhejo aur aage badho, decision result callback pe
+                    if process:
+                        with self.timings.stage("analyze"):
+                            self.detector.submit(frame, captured_at)
+                    elif self.last_result is not None:
+                        # Scene static - pichle result se hi timers aage badhao
+                        self._decide(self.last_result, captured_at, True, motion_done - frame_start, 0.0)
+                else:
+                    result = None
+                    if process:
+                        # Frame ko analyze karo - detector se
+                        with self.timings.stage("analyze"):
+                            result = self.detector.analyze_frame(frame)
+                        pool_wait = getattr(self.detector, "last_wait", 0.0)
+                    reused = result is None
+                    if reused:
+                        # Kuch nahi badla (ya shared detector pool busy tha) - pichla result hi sahi hai
+                        result = self.last_result
+                        if result is None:
+                            continue
+                    analyze_done = time.perf_counter()
+                    self._decide(result, captured_at, reused, motion_done - frame_start,
+                                 analyze_done - motion_done)
+            except Exception as e:
+                # Analysis hi nahi chal raha (jaise worker mar gaya, restart bhi fail) -
+                # chupchaap thread khatam mat karo, monitoring band karke UI ko batao
+                self._on_detector_failure(e)
+                break
+            frame_done = time.perf_counter()
+            
+            # CPU governor - is frame ka cost do, window poora ho to naya level
+            # (shared detector pool ka wait kaam nahi hai, woh nikal do)
+            if self.governor is not None:
+                self.governor.record_frame(frame_done - frame_start - pool_wait)
+                if self.governor.update():
+                    self._apply_governor_level()
+            
+            # Frame rate control - state ke hisaab se, CPU ko overload mat karo
             elapsed = time.time() - self.last_frame_time
-            target_delay = 1.0 / FPS_EST
+            target_delay = self.scheduler.frame_interval()
+            if self.governor is not None:
+                target_delay = max(target_delay, self.governor.frame_interval())
             
             if elapsed < target_delay:
                 time.sleep(target_delay - elapsed)  # Thoda wait karo
             
             self.last_frame_time = time.time()
         
-        # Loop end hone pe cleanup karo
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        log.info("✓ Monitor band ho gaya")
+    
+    def _on_detector_failure(self, error):
+        """Analysis thread - frame analysis fail: is_running band, error event callback/subscribers ko"""
+        log.error("❌ ERROR: Frame analysis fail ho gaya, monitoring band - %s", error)
+        self.error = str(error)
+        self.is_running = False
+        self._emit({"error": self.error})
+    
+    def _decide(self, result, captured_at, reused, motion_seconds, analyze_seconds):
+        """
+        Ek result pe peeking decision - analysis thread ya async detector ke callback se
+        Timers, alert, scheduler aur history yahi update hote hain
+        """
+        with self._decision_lock:
+            self.last_result = result
+            current_time = time.time()
+            if self.first_frame_latency is None:
+                self.first_frame_latency = current_time - self.started_at
+            
+            # Frame age track karo - decision kitne purane frame pe ho raha hai
+            self.last_frame_age = current_time - captured_at
+            self.avg_frame_age += 0.1 * (self.last_frame_age - self.avg_frame_age)
+            
+            # Peeking decision lo - timer, alert aur scheduler update
+            decision_start = time.perf_counter()
+            with self.timings.stage("decision"):
+                self._process_result(result, current_time)
+            
+            if self.history is not None:
+                self.history.append(
+                    current_time, result, self.alert_active, reused, self.last_frame_age,
+                    (motion_seconds, analyze_seconds, time.perf_counter() - decision_start),
+                )
+            self.result_stream.publish(result)
+    
+    def _on_async_result(self, result, captured_at, inference_seconds):
+        """AsyncFaceDetector ka result (MediaPipe thread) - seedha decision"""
+        if not self.is_running:
+            return
+        if captured_at is None:
+            captured_at = time.time()
+        self._decide(result, captured_at, False, 0.0, inference_seconds)
+    
+    def _apply_governor_level(self):
+        """
+        Governor ka naya level lagao - inference width yahi (analysis thread),
+        capture resolution capture thread agle grab pe lagata hai
+        """
+        capture_scale, inference_scale = self.governor.level_config()
+        log.info("⚙ CPU governor level %d - capture x%.2f, inference x%.2f",
+                 self.governor.level, capture_scale, inference_scale)
+        
+        # Inference width level 0 wali width ke relative (capture scale se alag)
+        if hasattr(self.detector, "inference_width"):
+            if inference_scale >= 1.0:
+                self.detector.inference_width = self._base_inference_width
+            else:
+                base = self._base_inference_width or self._base_frame_size[0]
+                self.detector.inference_width = int(base * inference_scale)
+        self._capture_scale = capture_scale
+    
+    def _apply_capture_scale(self):
+        """Capture thread - governor ka capture scale source pe lagao"""
+        scale = self._capture_scale
+        self._applied_capture_scale = scale
+        if self._base_frame_size is None:
+            return
+        width, height = self._base_frame_size
+        if self.source.set_resolution(int(width * scale), int(height * scale)):
+            log.info("⚙ Capture resolution ab %s", self.source.describe())
+            # Keyframe purane size ka hai - agla frame full mesh pe
+            flow = getattr(self.detector, "flow", None)
+            if flow is not None:
+                flow.stop()
+    
+    def _update_observer_timers(self, result, current_time):
+        """
+        Per-observer dwell timers update karo
+        Observer dekh raha hai = timer chalu, nazar hatayi = timer band,
+        frame me dikha hi nahi = OBSERVER_GRACE_SECONDS tak timer zinda (detection flicker)
+        """
+        observers = result.observers
+        if observers is None:
+            # Detector ne observer IDs nahi diye - poore frame ko ek observer maano
+            observers = _WHOLE_FRAME_PEEKING if result.peeking else _WHOLE_FRAME_IDLE
+        
+        seen = set()
+        for observer in observers:
+            observer_id = observer.id
+            seen.add(observer_id)
+            timer = self.observer_timers.get(observer_id)
+            
+            if observer.peeking:
+                if timer is None:
+                    # Pehli baar dekha - is observer ka timer start karo
+                    self.observer_timers[observer_id] = [current_time, current_time]
+                    log.info("👀 Peeking shuru hui! (%d faces detected)", result.face_count)
+                else:
+                    timer[1] = current_time  # Last seen update
+            elif timer is not None:
+                # Is observer ne nazar hata li
+                del self.observer_timers[observer_id]
+                log.info("✓ Peeking band ho gayi (%.1fs ke baad)", current_time - timer[0])
+        
+        # Jo observers frame me dikhe hi nahi - grace period ke baad hata do
+        for observer_id, (start, last_seen) in list(self.observer_timers.items()):
+            if observer_id not in seen and current_time - last_seen > OBSERVER_GRACE_SECONDS:
+                del self.observer_timers[observer_id]
+                log.info("✓ Peeking band ho gayi (%.1fs ke baad)", last_seen - start)
+    
+    def _process_result(self, result, current_time):
+        """
+        Ek analyzed frame ka result process karo - peeking timer aur alerts
+        Capture se alag rakha hai taaki benchmark/replay bhi yahi logic chala sakein
+        """
+        # Har observer ka apna dwell timer - ek flicker karta face sabka timer reset nahi karega
+        self._update_observer_timers(result, current_time)
         
-        print("✓ Monitor band ho gaya")
+        # PEEKING DETECTION LOGIC - yeh core logic hai!
+        if self.observer_timers:
+            # Koi dekh raha hai screen ko!
+            # Sabse purana chal raha timer = sabse lamba dwell
+            self.peeking_start_time = min(start for start, _ in self.observer_timers.values())
+            
+            # Kitne der se dekh raha hai calculate karo
+            peeking_duration = current_time - self.peeking_start_time
+            
+            # Agar required seconds se zyada time ho gaya
+            if peeking_duration >= self.required_seconds and not self.alert_active:
+                # ALERT TRIGGER KARO!
+                self.alert_active = True
+                log.warning("🚨 ALERT! Peeking %.1f seconds se ho rahi hai!", peeking_duration)
+                
+                # Callback call karo - UI ko batao alert dikhane ke liye
+                self._emit({
+                    "alert": True,
+                    "duration": peeking_duration,
+                    "triggered_at": time.perf_counter(),  # UI alert latency isi se
+                })
+        
+        else:
+            # Peeking nahi ho rahi - koi nahi dekh raha ya sirf ek face hai
+            
+            # Timer reset karo
+            self.peeking_start_time = None
+            
+            if self.alert_active:
+                # Alert deactivate karo
+                self.alert_active = False
+                log.info("✓ Alert deactivate - ab safe hai")
+                
+                # Callback call karo - UI ko batao alert band karne ke liye
+                self._emit({"alert": False})
+        
+        # Scheduler ko batao kya hua - agla frame kab lena hai woh decide karega
+        self.scheduler.update(
+            result.face_count,
+            self.peeking_start_time is not None,
+            self.alert_active,
+            current_time
+        )
     
     def get_status(self):
         """Current monitoring status check karo"""
         return {
             "is_running": self.is_running,
+            "error": self.error,                       # Detector failure (None = sab theek)
             "alert_active": self.alert_active,
             "peeking_duration": (
                 time.time() - self.peeking_start_time 
                 if self.peeking_start_time else 0
-            )
+            ),
+            "observers": {                             # observer_id -> dwell (seconds)
+                observer_id: time.time() - start
+                for observer_id, (start, _) in list(self.observer_timers.items())
+            },
+            "first_frame_latency": self.first_frame_latency,  # start() se pehla result (s)
+            "frame_age": self.last_frame_age,          # Last decision ke time frame ki age (s)
+            "avg_frame_age": self.avg_frame_age,      # Frame age ka moving average (s)
+            "frames_captured": self.frame_slot.frames_written,
+            "frames_dropped": self.frame_slot.frames_dropped,
+            "source": self.source.describe(),
+            "scheduler": self.scheduler.get_stats(),   # State, fps aur har state me bita time
+            "motion_gate": (                           # Processed vs skipped frames
+                self.motion_gate.get_stats() if self.motion_gate is not None else None
+            ),
+            "timings": self.timings.get_stats(),       # Har stage ka count/mean/p95/max (ms)
+            "governor": self._governor_status(),       # CPU use, budget aur current level
+            "async_detector": (                        # Submitted/dropped/completed frames
+                self.detector.get_stats() if self.asynchronous else None
+            ),
+            "streams": {                               # Async subscribers, queue depth, drops
+                "events": self.event_stream.get_stats(),
+                "results": self.result_stream.get_stats(),
+            },
+            "history": (                               # Ring buffer me kitne frames / seconds
+                self.history.get_stats() if self.history is not None else None
+            ),
         }
     
+    def export_history(self, path):
+        """Detection history file me likho - .npz ya .csv (extension se)"""
+        if self.history is None:
+            raise RuntimeError("History band hai - Monitor(history=True) se chalao")
+        self.history.save(path)
+        log.info("✓ History export ho gaya: %s (%d frames)", path, self.history.size)
+    
+    def _governor_status(self):
+        """Governor ke decisions + jo resolution abhi sach me lagi hai"""
+        if self.governor is None:
+            return None
+        status = self.governor.get_stats()
+        status["inference_width"] = getattr(self.detector, "inference_width", None)
+        status["frame_interval"] = max(
+            self.scheduler.frame_interval(), self.governor.frame_interval()
+        )
+        return status
+    
     def cleanup(self):
         """Sab resources cleanup karo - memory leak avoid karne ke liye"""
         self.stop()
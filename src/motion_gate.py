@@ -0,0 +1,72 @@
+import cv2
+import numpy as np
+
+# Configuration Constants - motion gate settings
+THUMB_SIZE = (32, 24)          # Tiny grayscale thumbnail (width, height)
+PIXEL_THRESHOLD = 12           # Ek pixel itna (0-255) badle to "changed" maana jayega
+CHANGED_FRACTION = 0.01        # Itne fraction pixels badle to frame ko changed maano
+MAX_SKIP_SECONDS = 1.0         # Scene static ho tab bhi itni der me ek baar full inference
+
+
+class MotionGate:
+    """
+    Sasta motion gate - tiny grayscale thumbnail pe frame differencing
+    Scene nahi badla to pichla analyze_frame result reuse karo, FaceMesh skip
+    """
+    def __init__(self, thumb_size=THUMB_SIZE, pixel_threshold=PIXEL_THRESHOLD,
+                 changed_fraction=CHANGED_FRACTION, max_skip_seconds=MAX_SKIP_SECONDS):
+        self.thumb_size = thumb_size
+        self.pixel_threshold = pixel_threshold
+        self.changed_fraction = changed_fraction
+        self.max_skip_seconds = max_skip_seconds
+
+        # Preallocated buffers - har frame pe allocation nahi
+        w, h = thumb_size
+        self._small = np.empty((h, w, 3), dtype=np.uint8)
+        self._gray = np.empty((h, w), dtype=np.uint8)
+        self._reference = np.empty((h, w), dtype=np.uint8)
+        self._diff = np.empty((h, w), dtype=np.uint8)
+        self._min_changed = max(1, int(changed_fraction * w * h))
+
+        self.reset()
+
+    def reset(self):
+        """Reference bhool jao - agla frame zaroor process hoga"""
+        self._has_reference = False
+        self._last_refresh = 0.0
+        self.processed = 0   # Kitne frames pe full inference chala
+        self.skipped = 0     # Kitne frames pe pichla result reuse hua
+
+    def should_process(self, frame, now):
+        """
+        Frame pe full inference chahiye ya nahi
+        True = scene badla / refresh ka time / reference nahi hai
+        """
+        cv2.resize(frame, self.thumb_size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if self._has_reference and now - self._last_refresh < self.max_skip_seconds:
+            cv2.absdiff(self._gray, self._reference, dst=self._diff)
+            changed = cv2.countNonZero(
+                cv2.threshold(self._diff, self.pixel_threshold, 255, cv2.THRESH_BINARY,
+                              dst=self._diff)[1]
+            )
+            if changed < self._min_changed:
+                self.skipped += 1
+                return False
+
+        # Process hoga - yahi frame naya reference hai
+        np.copyto(self._reference, self._gray)
+        self._has_reference = True
+        self._last_refresh = now
+        self.processed += 1
+        return True
+
+    def get_stats(self):
+        """Processed vs skipped frames"""
+        total = self.processed + self.skipped
+        return {
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "skip_ratio": self.skipped / total if total else 0.0,
+        }
@@ -0,0 +1,304 @@
+import threading
+import time
+from collections import deque
+
+from app_logging import get_logger
+from async_stream import AsyncStream
+from detector import FaceDetector
+from detector_worker import ProcessDetector
+from governor import CpuGovernor
+from landmark_flow import LandmarkFlow
+from monitor import (CPU_GOVERNOR_ENABLED, MULTI_RES_ENABLED, MULTI_RES_INFERENCE_WIDTH, Monitor,
+                     REQUIRED_SECONDS)
+from tracker import FaceTracker
+
+log = get_logger("multi_monitor")
+
+# Configuration Constants - multi-camera settings
+DETECTOR_POOL_SIZE = 2        # Kitne detector instances saare cameras me baante jayenge
+POOL_USE_PROCESSES = False    # True = har detector alag process me (ProcessDetector)
+POOL_ACQUIRE_TIMEOUT = 1.0    # Detector ka max wait - itne me na mile to frame chhod do
+
+# Yeh detector state har camera ki apni hai - pooled detector lene pe camera wali swap hoti hai
+CAMERA_STATE_ATTRS = ("tracker", "flow", "_gate_hold", "_frames_since_mesh", "timings")
+
+# Yeh kwargs Monitor ke nahi, pool ke FaceDetectors ke hain
+POOL_DETECTOR_KWARGS = ("inference_width", "roi_refine", "backend", "num_threads")
+
+
+class DetectorPool:
+    """
+    Bounded detector pool - N cameras ke beech kuch hi detectors
+    Wait karne wale cameras FIFO order me detector paate hain (koi camera starve nahi hota)
+    Free detector me pehle woh lo jo isi camera ko last serve kar raha tha - uske buffers
+    isi camera ke frame size ke bane hain
+    Backends static_image_mode me bante hain - FaceMesh ki tracking state ek camera ke
+    faces doosre camera ke frame me na le jaye (har camera ki tracking apne FaceTracker me)
+    """
+    def __init__(self, size=DETECTOR_POOL_SIZE, use_processes=POOL_USE_PROCESSES,
+                 **detector_kwargs):
+        """
+        use_processes = True pe ProcessDetector workers - unka tracker worker ke andar hai
+        aur cameras ke beech swap nahi ho sakta, isliye waha tracking band rehti hai
+        """
+        self.size = size
+        self.use_processes = use_processes
+        detector_kwargs = dict(detector_kwargs, static_image_mode=True)
+        if use_processes:
+            detector_kwargs = dict(detector_kwargs, use_tracker=False)
+            self.detectors = [ProcessDetector(**detector_kwargs) for _ in range(size)]
+        else:
+            self.detectors = [FaceDetector(**detector_kwargs) for _ in range(size)]
+
+        self._cond = threading.Condition()
+        self._free = list(range(size))           # Free detectors ke index
+        self._last_camera = [None] * size        # Har detector ne last kis camera ko serve kiya
+        self._waiting = deque()                  # Wait kar rahe cameras ke tickets (FIFO)
+
+        self.grants = {}        # camera -> kitni baar detector mila
+        self.timeouts = {}      # camera -> kitni baar timeout hua
+        self.wait_seconds = {}  # camera -> total wait time
+
+    def acquire(self, camera, timeout=POOL_ACQUIRE_TIMEOUT):
+        """
+        Camera ke liye detector lo - (index, detector), timeout pe (None, None)
+        Queue me apni baari aane tak wait karo
+        """
+        ticket = object()
+        start = time.monotonic()
+        with self._cond:
+            self._waiting.append(ticket)
+            try:
+                while not (self._free and self._waiting[0] is ticket):
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        self.timeouts[camera] = self.timeouts.get(camera, 0) + 1
+                        return None, None
+                    self._cond.wait(remaining)
+
+                # Affinity - isi camera wala detector free ho to wahi
+                index = self._free[0]
+                for candidate in self._free:
+                    if self._last_camera[candidate] == camera:
+                        index = candidate
+                        break
+                self._free.remove(index)
+                self._last_camera[index] = camera
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()  # Agla ticket head pe aaya - use jagao
+
+        self.grants[camera] = self.grants.get(camera, 0) + 1
+        self.wait_seconds[camera] = self.wait_seconds.get(camera, 0.0) + time.monotonic() - start
+        return index, self.detectors[index]
+
+    def release(self, index):
+        """Detector wapas pool me do"""
+        with self._cond:
+            self._free.append(index)
+            self._cond.notify_all()
+
+    def get_stats(self):
+        """Pool ka status - har camera ko kitne slots mile aur kitna wait hua"""
+        with self._cond:
+            busy = self.size - len(self._free)
+            waiting = len(self._waiting)
+        return {
+            "size": self.size,
+            "busy": busy,
+            "waiting": waiting,
+            "grants": dict(self.grants),
+            "timeouts": dict(self.timeouts),
+            "avg_wait_ms": {
+                camera: 1000.0 * total / self.grants[camera]
+                for camera, total in list(self.wait_seconds.items())
+                if self.grants.get(camera)
+            },
+        }
+
+    def cleanup(self):
+        """Saare detectors band karo"""
+        for detector in self.detectors:
+            detector.cleanup()
+
+
+class PooledDetector:
+    """
+    Ek camera ka detector handle - FaceDetector jaisa interface, inference pool se
+    Camera ki apni state (tracker, gate counters, timings) har call pe detector me swap hoti hai
+    """
+    def __init__(self, pool, camera):
+        self.pool = pool
+        self.camera = camera
+        self.tracker = None
+        self.flow = None
+        if not pool.use_processes:
+            template = pool.detectors[0]
+            self.tracker = FaceTracker() if template.tracker is not None else None
+            if template.flow is not None:
+                self.flow = LandmarkFlow(template.flow.keyframe_interval)
+        self._gate_hold = 0
+        self._frames_since_mesh = 0
+        self.timings = None  # Monitor set karta hai
+        self.last_wait = 0.0  # Last frame pe pool ka wait - governor ise cost me nahi ginta
+
+    def analyze_frame(self, frame):
+        """Pool se detector lo, camera ki state ke saath frame analyze karo"""
+        start = time.perf_counter()
+        index, detector = self.pool.acquire(self.camera)
+        self.last_wait = time.perf_counter() - start
+        if detector is None:
+            # Saare detectors busy - yeh frame chhod do, Monitor pichla result use karega
+            return None
+
+        saved = {}
+        try:
+            if not self.pool.use_processes:
+                for name in CAMERA_STATE_ATTRS:
+                    saved[name] = getattr(detector, name)
+                    setattr(detector, name, getattr(self, name))
+            return detector.analyze_frame(frame)
+        finally:
+            # Camera ki updated state wapas lo, detector ki apni state lautao
+            for name, value in saved.items():
+                setattr(self, name, getattr(detector, name))
+                setattr(detector, name, value)
+            self.pool.release(index)
+
+    def cleanup(self):
+        """Detectors pool ke hain - MultiMonitor unhe band karta hai"""
+
+
+class MultiMonitor:
+    """
+    Kai cameras ek saath monitor karo - har camera ka apna Monitor (capture, scheduler,
+    observer timers, alert state), detection ek shared bounded pool se
+    Idle cameras ka scheduler dheere frames leta hai, isliye unhe pool slots bhi kam milte hain
+    """
+    def __init__(self, cameras=(0,), sources=None, required_seconds=REQUIRED_SECONDS,
+                 pool_size=DETECTOR_POOL_SIZE, use_processes=POOL_USE_PROCESSES,
+                 **monitor_kwargs):
+        """
+        cameras = webcam indices (ya sources ke naam)
+        sources = optional {camera: FrameSource} - na diya ho to webcam index se banega
+        governor = True/False ya CpuGovernor - budget cameras me barabar bant jata hai,
+        har camera ka apna governor apne frames ka cost naapta hai
+        inference_width / roi_refine / backend / num_threads = pool ke detectors ke liye
+        (multi_res pe Monitor jaise downscaled mesh + ROI refinement default)
+        """
+        sources = sources or {}
+        governor = monitor_kwargs.pop("governor", CPU_GOVERNOR_ENABLED)
+        if governor is True:
+            governor = CpuGovernor()
+        detector_kwargs = {}
+        if monitor_kwargs.get("multi_res", MULTI_RES_ENABLED):
+            detector_kwargs = {"inference_width": MULTI_RES_INFERENCE_WIDTH, "roi_refine": True}
+        for name in POOL_DETECTOR_KWARGS:
+            if name in monitor_kwargs:
+                detector_kwargs[name] = monitor_kwargs.pop(name)
+        self.pool = DetectorPool(pool_size, use_processes=use_processes, **detector_kwargs)
+        self.callback = None
+        self.event_stream = AsyncStream()  # events() subscribers - aggregated alerts
+        self.alert_active = False
+        self._lock = threading.Lock()
+
+        self.monitors = {}
+        for camera in cameras:
+            monitor = Monitor(
+                webcam_index=camera if isinstance(camera, int) else 0,
+                required_seconds=required_seconds,
+                detector=PooledDetector(self.pool, camera),
+                source=sources.get(camera),
+                governor=self._camera_governor(governor, len(cameras)),
+                **monitor_kwargs
+            )
+            monitor.register_callback(
+                lambda event, camera=camera: self._on_camera_event(camera, event)
+            )
+            self.monitors[camera] = monitor
+
+    @staticmethod
+    def _camera_governor(governor, camera_count):
+        """Ek camera ka governor - shared budget ka barabar hissa, baaki settings wahi"""
+        if not governor:
+            return None
+        return CpuGovernor(
+            budget=governor.budget / camera_count, levels=governor.levels,
+            window=governor.window, min_fps=governor.min_fps,
+            upshift_headroom=governor.upshift_headroom, hold_windows=governor.hold_windows,
+            max_interval=governor.max_interval,
+        )
+
+    def register_callback(self, callback):
+        """Aggregated alert callback - koi bhi camera alert kare to ek event"""
+        self.callback = callback
+
+    def events(self, maxlen=None):
+        """async for event in multi.events() - aggregated alert on/off (camera ke saath)"""
+        return self.event_stream.subscribe(maxlen)
+
+    def _on_camera_event(self, camera, event):
+        """
+        Ek camera ka alert event - aggregated state update karo
+        Pehla camera alert kare to alert on, aakhri camera safe ho to alert off
+        Camera ka error event (monitoring band) seedha aage jata hai
+        """
+        if "error" in event:
+            log.error("❌ Camera %s band ho gaya - %s", camera, event["error"])
+            failed = dict(event, camera=camera)
+            if self.callback:
+                self.callback(failed)
+            self.event_stream.publish(failed)
+            return
+
+        with self._lock:
+            # Monitor callback se pehle hi apna alert_active set kar deta hai
+            active = [c for c, m in self.monitors.items() if m.alert_active]
+            was_active = self.alert_active
+            self.alert_active = bool(active)
+            changed = self.alert_active != was_active
+
+        if event["alert"]:
+            log.warning("🚨 Camera %s pe alert!", camera)
+        if changed:
+            aggregated = dict(event, camera=camera, active_cameras=active)
+            if self.callback:
+                self.callback(aggregated)
+            self.event_stream.publish(aggregated)
+
+    def start(self):
+        """Saare cameras ka monitoring start karo"""
+        started = [monitor.start() for monitor in self.monitors.values()]
+        return any(started)
+
+    def stop(self):
+        """Saare cameras band karo"""
+        for monitor in self.monitors.values():
+            monitor.stop()
+        self.alert_active = False
+        self.event_stream.close()
+
+    @property
+    def is_running(self):
+        return any(monitor.is_running for monitor in self.monitors.values())
+
+    def get_status(self):
+        """Har camera ka status + aggregated alert + pool stats"""
+        cameras = {camera: monitor.get_status() for camera, monitor in self.monitors.items()}
+        return {
+            "is_running": self.is_running,
+            "alert_active": self.alert_active,
+            "active_cameras": [c for c, s in cameras.items() if s["alert_active"]],
+            "peeking_duration": max(
+                (s["peeking_duration"] for s in cameras.values()), default=0
+            ),
+            "cameras": cameras,
+            "pool": self.pool.get_stats(),
+            "events": self.event_stream.get_stats(),
+        }
+
+    def cleanup(self):
+        """Cameras aur pool ke detectors band karo"""
+        for monitor in self.monitors.values():
+            monitor.cleanup()
+        self.pool.cleanup()
@@ -0,0 +1,77 @@
+"""
+Detector result types - har frame pe dicts ki jagah chhote __slots__ objects
+Objects read-only hain, isliye common results (no_faces, single_face...) ek hi baar bante
+hain aur har frame pe wahi lautaye jaate hain
+"""
+
+
+class _Frozen:
+    """__slots__ base - banne ke baad koi field nahi badal sakta (shared constants safe)"""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} read-only hai")
+
+    def __reduce__(self):
+        # ProcessDetector queue ke through pickle - slots ko constructor args ki tarah bhejo
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class FaceObservation(_Frozen):
+    """
+    Ek secondary face (observer) ka gaze result
+    id = tracker ka stable ID (tracker band ho to size rank), bbox = (x0, y0, x1, y1)
+    normalized, left_iris/right_iris = eye ke andar (x, y) position (0.5 = center)
+    gaze_reused = pose same tha, tracker ka cached gaze use hua (iris is frame me nahi nikla)
+    """
+    __slots__ = ("id", "peeking", "confidence", "bbox", "left_iris", "right_iris",
+                 "gaze_reused")
+
+    def __init__(self, id, peeking, confidence=0.0, bbox=None, left_iris=None,
+                 right_iris=None, gaze_reused=False):
+        super().__init__(id, peeking, confidence, bbox, left_iris, right_iris, gaze_reused)
+
+    def to_dict(self):
+        """JSON/logging ke liye plain dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class FrameResult(_Frozen):
+    """
+    Ek frame ka analyze_frame result
+    observers = FaceObservation tuple (sirf tracker on ho tab), warna None -
+    tab Monitor poore frame ko ek observer maanta hai
+    """
+    __slots__ = ("face_count", "peeking", "confidence", "reason", "observers")
+
+    def __init__(self, face_count, peeking, confidence, reason, observers=None):
+        super().__init__(face_count, peeking, confidence, reason, observers)
+
+    def to_dict(self):
+        """JSON/logging ke liye plain dict (observers bhi dicts)"""
+        result = {name: getattr(self, name) for name in self.__slots__}
+        if self.observers is not None:
+            result["observers"] = [observer.to_dict() for observer in self.observers]
+        return result
+
+
+# Har frame pe dobara banane ki zarurat nahi - yeh results kabhi nahi badalte
+NO_FRAME = FrameResult(0, False, 0.0, "no_frame")
+NO_FACES = FrameResult(0, False, 0.0, "no_faces")
+SINGLE_FACE = FrameResult(1, False, 0.0, "single_face")
@@ -0,0 +1,92 @@
+import time
+
+# Scheduler states - monitoring kis haalat me hai
+STATE_IDLE = "idle"                    # 0-1 face - koi peeking possible nahi
+STATE_ALERT_PENDING = "alert_pending"  # 2+ faces ya peeking timer chal raha hai
+STATE_ALERT_ACTIVE = "alert_active"    # Alert dikh raha hai
+
+# Configuration Constants - har state ka frame rate
+IDLE_FPS = 4            # Idle me dheere chalo - battery aur thermals ke liye
+PENDING_FPS = 20        # Peeking ka shak hai - full rate pe check karo
+ACTIVE_FPS = 10         # Alert dikh raha hai - bas itna dekhna hai ki peeking kab ruki
+FACE_THRESHOLD = 2      # Itne ya zyada faces pe idle se bahar aao
+IDLE_COOLDOWN = 2.0     # Faces hatne ke baad itne seconds tak full rate pe raho
+
+
+class FrameScheduler:
+    """
+    Adaptive frame-rate scheduler - fixed FPS ki jagah state ke hisaab se rate
+    Monitor har frame ke baad update() call karta hai aur frame_interval() tak sota hai
+    """
+    def __init__(self, idle_fps=IDLE_FPS, pending_fps=PENDING_FPS, active_fps=ACTIVE_FPS,
+                 face_threshold=FACE_THRESHOLD, idle_cooldown=IDLE_COOLDOWN):
+        """Transition rules aur rates configure karo"""
+        self.fps = {
+            STATE_IDLE: idle_fps,
+            STATE_ALERT_PENDING: pending_fps,
+            STATE_ALERT_ACTIVE: active_fps,
+        }
+        self.face_threshold = face_threshold
+        self.idle_cooldown = idle_cooldown
+        self.reset()
+
+    def reset(self, now=None):
+        """Scheduler ko idle state me wapas lao - stats bhi saaf"""
+        now = time.time() if now is None else now
+        self.state = STATE_IDLE
+        self.state_since = now
+        self.last_busy_time = None  # Last baar kab 2+ faces / peeking dikha
+        self.transitions = 0
+        self.time_in_state = {
+            STATE_IDLE: 0.0,
+            STATE_ALERT_PENDING: 0.0,
+            STATE_ALERT_ACTIVE: 0.0,
+        }
+
+    def update(self, face_count, peeking_active, alert_active, now=None):
+        """
+        Latest result ke basis pe state decide karo
+        peeking_active = Monitor ka peeking_start_time chal raha hai ya nahi
+        """
+        now = time.time() if now is None else now
+
+        if alert_active:
+            new_state = STATE_ALERT_ACTIVE
+        elif peeking_active or face_count >= self.face_threshold:
+            new_state = STATE_ALERT_PENDING
+        elif (
+            self.last_busy_time is not None
+            and now - self.last_busy_time < self.idle_cooldown
+        ):
+            # Abhi-abhi koi tha - turant idle mat jao, flicker se bacho
+            new_state = STATE_ALERT_PENDING
+        else:
+            new_state = STATE_IDLE
+
+        if alert_active or peeking_active or face_count >= self.face_threshold:
+            self.last_busy_time = now
+
+        if new_state != self.state:
+            # Purani state ka time jodo aur switch karo
+            self.time_in_state[self.state] += now - self.state_since
+            self.state = new_state
+            self.state_since = now
+            self.transitions += 1
+
+        return self.state
+
+    def frame_interval(self):
+        """Current state ke hisaab se do frames ke beech ka gap (seconds)"""
+        return 1.0 / self.fps[self.state]
+
+    def get_stats(self, now=None):
+        """Scheduler ka status - current state, rate aur har state me bita time"""
+        now = time.time() if now is None else now
+        time_in_state = dict(self.time_in_state)
+        time_in_state[self.state] += now - self.state_since
+        return {
+            "state": self.state,
+            "fps": self.fps[self.state],
+            "transitions": self.transitions,
+            "time_in_state": time_in_state,
+        }
@@ -0,0 +1,97 @@
+import time
+
+import numpy as np
+
+# Configuration Constants - timing instrumentation
+TIMING_ENABLED = False   # Default band - on karne pe hi overhead lagega
+TIMING_WINDOW = 256      # Har stage ke kitne latest samples rakhne hain (rolling)
+
+
+class StageStats:
+    """Ek stage ka rolling histogram - fixed-size ring, koi per-sample allocation nahi"""
+    def __init__(self, window=TIMING_WINDOW):
+        self._samples = np.zeros(window, dtype=np.float64)
+        self._pos = 0
+        self._filled = 0
+        self.count = 0  # Total kitni baar record hua (window se bahar wale bhi)
+
+    def add(self, seconds):
+        """Ek sample jodo - purana sample overwrite ho jata hai"""
+        self._samples[self._pos] = seconds
+        self._pos = (self._pos + 1) % len(self._samples)
+        if self._filled < len(self._samples):
+            self._filled += 1
+        self.count += 1
+
+    def summary(self):
+        """Window ka summary - milliseconds me"""
+        if self._filled == 0:
+            return {"count": 0, "mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        window = self._samples[:self._filled] * 1000.0
+        return {
+            "count": self.count,
+            "mean_ms": float(window.mean()),
+            "p95_ms": float(np.percentile(window, 95)),
+            "max_ms": float(window.max()),
+        }
+
+
+class _StageTimer:
+    """Ek stage ka context manager - har stage ke liye ek hi object reuse hota hai"""
+    def __init__(self, stats):
+        self._stats = stats
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stats.add(time.perf_counter() - self._start)
+        return False
+
+
+class _NullTimer:
+    """Timing band ho to yeh milta hai - kuch nahi karta"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class StageTimings:
+    """
+    Hot-path stages ke monotonic timers - capture, colour conversion, FaceMesh, gaze...
+    Usage: with timings.stage("facemesh"): ...
+    Har stage ko ek hi thread se time karo (timer object per stage reuse hota hai)
+    """
+    def __init__(self, enabled=TIMING_ENABLED, window=TIMING_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self._stats = {}
+        self._timers = {}
+
+    def stage(self, name):
+        """Stage ka timer lo - disabled ho to shared no-op timer"""
+        if not self.enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(name)
+        if timer is None:
+            stats = StageStats(self.window)
+            timer = _StageTimer(stats)
+            self._stats[name] = stats
+            self._timers[name] = timer
+        return timer
+
+    def get_stats(self):
+        """Har stage ka summary - {stage: {count, mean_ms, p95_ms, max_ms}}"""
+        return {name: stats.summary() for name, stats in list(self._stats.items())}
+
+    def reset(self):
+        """Saare samples saaf karo"""
+        self._stats = {}
+        self._timers = {}
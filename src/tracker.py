@@ -0,0 +1,135 @@
+import numpy as np
+
+# Configuration Constants - tracking settings
+IOU_MATCH_THRESHOLD = 0.3     # Itna overlap ho to same face maana jayega
+CENTROID_MATCH_DISTANCE = 0.5 # IoU kam ho to bhi center itna paas (face size ke hisaab se) = same face
+MAX_MISSED_FRAMES = 10        # Face itne frames tak na dikhe tab bhi track zinda rahega (flicker)
+POSE_CHANGE_TOLERANCE = 0.03  # Bbox itna (face size ke fraction me) hi hila to pose same maano
+GAZE_REUSE_MAX_FRAMES = 4     # Cached gaze max itne frames tak reuse, phir fresh evaluation
+
+
+def _iou_matrix(a, b):
+    """Do bbox sets (T, 4) aur (K, 4) ka IoU matrix (T, K) - normalized coords"""
+    x0 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y0 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x1 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y1 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x1 - x0, 0, None) * np.clip(y1 - y0, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.where(union > 0, union, 1.0), 0.0)
+
+
+class Track:
+    """Ek face ka track - stable ID, last bbox aur cached gaze"""
+    def __init__(self, track_id, bbox):
+        self.id = track_id
+        self.bbox = bbox          # (x0, y0, x1, y1) normalized
+        self.missed = 0           # Lagatar kitne frames se match nahi hua
+        self.hits = 1             # Kitni baar match hua
+
+        # Cached gaze - pose na badle to dobara evaluate nahi karte
+        self.gaze = None          # (is_looking, confidence)
+        self.gaze_bbox = None     # Kis bbox pe gaze evaluate hua tha
+        self.gaze_reused = 0      # Lagatar kitni baar cache use hua
+
+    def size(self):
+        """Bbox ka diagonal-jaisa size - distances normalize karne ke liye"""
+        return max(self.bbox[2] - self.bbox[0], self.bbox[3] - self.bbox[1], 1e-6)
+
+
+class FaceTracker:
+    """
+    Cross-frame face tracker - IoU + centroid matching se har face ko stable ID
+    Pehli baar sabse bade face ko primary user lock karta hai, jab tak woh track zinda hai
+    """
+    def __init__(self, iou_threshold=IOU_MATCH_THRESHOLD,
+                 centroid_distance=CENTROID_MATCH_DISTANCE,
+                 max_missed=MAX_MISSED_FRAMES):
+        self.iou_threshold = iou_threshold
+        self.centroid_distance = centroid_distance
+        self.max_missed = max_missed
+        self.reset()
+
+    def reset(self):
+        """Saare tracks bhool jao"""
+        self.tracks = []
+        self.primary_id = None
+        self._next_id = 1
+
+    def update(self, bboxes):
+        """
+        Naye frame ke bboxes (K, 4) ko tracks se match karo - K = 0 bhi chalega (sab missed)
+        Returns: har bbox ke liye uska Track (same order me)
+        """
+        assigned = [None] * len(bboxes)
+        unmatched_tracks = set(range(len(self.tracks)))
+
+        if self.tracks and len(bboxes):
+            track_boxes = np.array([t.bbox for t in self.tracks], dtype=np.float32)
+            iou = _iou_matrix(track_boxes, bboxes)
+
+            # Center distance - face size ke hisaab se normalize
+            track_centers = (track_boxes[:, :2] + track_boxes[:, 2:]) / 2
+            centers = (bboxes[:, :2] + bboxes[:, 2:]) / 2
+            sizes = np.array([t.size() for t in self.tracks], dtype=np.float32)
+            dist = np.linalg.norm(track_centers[:, None] - centers[None], axis=2) / sizes[:, None]
+
+            # Greedy matching - sabse zyada overlap wale pairs pehle
+            eligible = (iou >= self.iou_threshold) | (dist <= self.centroid_distance)
+            pairs = np.argwhere(eligible)
+            order = np.lexsort((dist[eligible], -iou[eligible]))
+            used_detections = set()
+            for t_idx, d_idx in pairs[order]:
+                if t_idx not in unmatched_tracks or d_idx in used_detections:
+                    continue
+                track = self.tracks[t_idx]
+                track.bbox = tuple(float(v) for v in bboxes[d_idx])
+                track.missed = 0
+                track.hits += 1
+                assigned[d_idx] = track
+                unmatched_tracks.discard(t_idx)
+                used_detections.add(d_idx)
+
+        # Jo tracks match nahi hue unka missed count badhao
+        for t_idx in unmatched_tracks:
+            self.tracks[t_idx].missed += 1
+
+        # Naye faces ke liye naye tracks
+        for d_idx, track in enumerate(assigned):
+            if track is None:
+                track = Track(self._next_id, tuple(float(v) for v in bboxes[d_idx]))
+                self._next_id += 1
+                self.tracks.append(track)
+                assigned[d_idx] = track
+
+        # Bahut der se gayab tracks hata do
+        self.tracks = [t for t in self.tracks if t.missed <= self.max_missed]
+        if self.primary_id is not None and not any(t.id == self.primary_id for t in self.tracks):
+            self.primary_id = None
+
+        # Primary user lock - pehli baar (ya primary khone pe) sabse bada visible face
+        if self.primary_id is None and assigned:
+            areas = (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
+            self.primary_id = assigned[int(np.argmax(areas))].id
+
+        return assigned
+
+    def can_reuse_gaze(self, track):
+        """Track ka pose nahi badla aur cache zyada purana nahi - to gaze reuse karo"""
+        if track.gaze is None or track.gaze_reused >= GAZE_REUSE_MAX_FRAMES:
+            return False
+        moved = max(abs(a - b) for a, b in zip(track.bbox, track.gaze_bbox))
+        return moved <= POSE_CHANGE_TOLERANCE * track.size()
+
+    def reuse_gaze(self, track):
+        """Cached gaze lo - (is_looking, confidence)"""
+        track.gaze_reused += 1
+        return track.gaze
+
+    def store_gaze(self, track, is_looking, confidence):
+        """Fresh gaze evaluation cache karo"""
+        track.gaze = (is_looking, confidence)
+        track.gaze_bbox = track.bbox
+        track.gaze_reused = 0
@@ -1,9 +1,21 @@
+import time
+APP_START = time.perf_counter()  # Startup timings isi se naapte hain
+
 import tkinter as tk
 from tkinter import font, messagebox
-from monitor import Monitor
+from event_bus import UIEventBus
 from ui_popup import AlertPopup
 import sys
 import platform
+import threading
+
+# Monitor (OpenCV + MediaPipe) yaha import nahi hota - window pehle dikhe, model background me
+
+# Configuration Constants
+SHOW_TIMINGS = False      # True = status panel me live per-stage timing dikhao
+TIMINGS_REFRESH_MS = 1000 # Timing readout kitni der me refresh ho
+TIMING_STAGES = ("grab", "gate", "preprocess", "facemesh", "gaze", "callback")
+WARMUP_POLL_MS = 100      # Background warm-up / pehle frame ka status kitni der me check ho
 
 class FourEyesApp:
     def __init__(self):
@@ -36,9 +48,22 @@ class FourEyesApp:
         
         self.root.configure(bg=self.bg_primary)
         
-        # Monitor aur popup initialize karo
-        self.monitor = Monitor()
-        self.monitor.register_callback(self._on_alert_event)
+        # Startup milestones - process start se seconds (window, model_ready, first_frame)
+        self.startup_times = {}
+        
+        # Monitor background thread me banega (heavy imports + FaceMesh + dummy inference)
+        # User Activate screen pe hai tab tak model ready ho jata hai
+        self.monitor = None
+        self._start_requested = False  # Warm-up ke dauraan Activate dabaya gaya
+        self._warmup_result = None     # Monitor ya Exception - background thread bharta hai
+        self._warmup_error = None      # Warm-up fail hua to Exception - Activate pe dobara try
+        self._warmup_done = threading.Event()
+        threading.Thread(target=self._warm_up, daemon=True).start()
+        
+        # Monitor thread -> Tk thread events - widgets sirf main thread pe chhue jayenge
+        # Drain loop sirf monitoring ke dauraan chalta hai (activate pe start, band pe stop)
+        self.events = UIEventBus(self.root, self._on_alert_event)
+        
         self.popup = AlertPopup()
         self.popup.register_deactivate_callback(self._deactivate_monitoring)  # Chalega button ke liye
         
@@ -53,6 +78,82 @@ class FourEyesApp:
         # Keyboard shortcuts bind karo
         self.root.bind('q', lambda e: self._on_close())
         self.root.bind('Q', lambda e: self._on_close())
+        
+        # Window screen pe aayi - time-to-window record karo
+        self.root.bind('<Map>', self._on_first_map)
+        self.root.after(WARMUP_POLL_MS, self._poll_warm_up)
+    
+    def _mark_startup(self, name):
+        """Startup milestone record karo - process start se kitne seconds"""
+        self.startup_times[name] = time.perf_counter() - APP_START
+        print(f"⏱ Startup: {name} {self.startup_times[name]:.2f}s")
+    
+    def _on_first_map(self, event):
+        """Main window pehli baar map hui"""
+        if event.widget is self.root and "window" not in self.startup_times:
+            self._mark_startup("window")
+            self.root.unbind('<Map>')
+    
+    def _warm_up(self):
+        """
+        Background thread - Monitor import/create karo aur model warm karo
+        Yaha Tk ko touch nahi karna, result _poll_warm_up main thread me uthata hai
+        """
+        try:
+            from monitor import Monitor
+            monitor = Monitor(timing=SHOW_TIMINGS)
+            monitor.warm_up()
+            self._warmup_result = monitor
+        except Exception as e:
+            self._warmup_result = e
+        self._warmup_done.set()
+    
+    def _poll_warm_up(self):
+        """Main thread - warm-up khatam hua to Monitor use karo"""
+        if not self._warmup_done.is_set():
+            self.root.after(WARMUP_POLL_MS, self._poll_warm_up)
+            return
+        
+        result = self._warmup_result
+        if isinstance(result, Exception):
+            print(f"❌ ERROR: Detector load nahi hua - {result}")
+            # Failure yaad rakho - warna Activate "Model Load Ho Raha Hai..." pe hi atka rahega
+            self._warmup_error = result
+            self._start_requested = False
+            self.status_label.config(text="Model Load Nahi Hua", fg=self.text_secondary)
+            messagebox.showerror("Error", f"Detector load nahi hua.\n\n{result}")
+            return
+        
+        self.monitor = result
+        # Monitor thread sirf queue me daalta hai - UI ka kabhi wait nahi karta
+        self.monitor.register_callback(self.events.publish)
+        self._mark_startup("model_ready")
+        
+        # User ne pehle hi Activate daba diya tha - ab start karo
+        if self._start_requested:
+            self._start_requested = False
+            self._toggle_monitoring()
+    
+    def _retry_warm_up(self):
+        """Pichla warm-up fail hua tha - background me dobara try, ready hote hi start"""
+        self._warmup_error = None
+        self._warmup_result = None
+        self._warmup_done.clear()
+        self._start_requested = True
+        self.status_label.config(text="Model Dobara Load Ho Raha Hai...", fg=self.text_secondary)
+        threading.Thread(target=self._warm_up, daemon=True).start()
+        self.root.after(WARMUP_POLL_MS, self._poll_warm_up)
+    
+    def _poll_first_frame(self):
+        """Activate ke baad pehla analyzed frame kab aaya - time-to-first-frame"""
+        if not self.is_active:
+            return
+        if self.monitor.first_frame_latency is None:
+            self.root.after(WARMUP_POLL_MS, self._poll_first_frame)
+            return
+        if "first_frame" not in self.startup_times:
+            self.startup_times["first_frame_latency"] = self.monitor.first_frame_latency
+            self._mark_startup("first_frame")
     
     def _create_ui(self):
         """Main UI elements create karo - sab kuch yaha design hoga"""
@@ -111,6 +212,21 @@ class FourEyesApp:
         )
         self.status_label.pack(side=tk.LEFT)
         
+        # Optional timing readout - har stage ka mean/p95 (debugging ke liye)
+        self.timing_label = None
+        if SHOW_TIMINGS:
+            self.timing_label = tk.Label(
+                main_frame,
+                text="",
+                font=("Consolas", 9),
+                bg=self.bg_primary,
+                fg=self.text_secondary,
+                justify=tk.LEFT,
+                wraplength=440
+            )
+            self.timing_label.pack(fill=tk.X)
+            self.root.after(TIMINGS_REFRESH_MS, self._refresh_timings)
+        
         # Bottom section - Activate button (main action)
         button_frame = tk.Frame(main_frame, bg=self.bg_primary)
         button_frame.pack(pady=20)
@@ -132,6 +248,24 @@ class FourEyesApp:
         )
         self.toggle_button.pack()
     
+    def _refresh_timings(self):
+        """Monitor ke stage timings status panel me dikhao - har second"""
+        if self.monitor is None:
+            self.root.after(TIMINGS_REFRESH_MS, self._refresh_timings)
+            return
+        timings = self.monitor.get_status()["timings"]
+        parts = [
+            f"{name} {timings[name]['mean_ms']:.1f}/{timings[name]['p95_ms']:.1f}ms"
+            for name in TIMING_STAGES if name in timings
+        ]
+        events = self.events.get_stats()
+        parts.append(f"ui q{events['depth']} {events['latency_mean_ms']:.1f}ms")
+        popup = self.popup.get_stats()
+        if popup["shows"]:
+            parts.append(f"alert {popup['last_latency_ms']:.0f}ms")
+        self.timing_label.config(text="  ".join(parts))
+        self.root.after(TIMINGS_REFRESH_MS, self._refresh_timings)
+    
     def _deactivate_monitoring(self):
         """
         Monitoring ko deactivate karo - Chalega button se call hoga
@@ -140,6 +274,7 @@ class FourEyesApp:
         if self.is_active:
             # Monitoring band karo
             self.monitor.stop()
+            self.events.stop()
             self.popup.hide_alert()  # Agar popup khula hai to band karo
             self.is_active = False
             
@@ -158,11 +293,25 @@ class FourEyesApp:
     
     def _toggle_monitoring(self):
         """Monitoring ko on/off karo - button click pe"""
+        if not self.is_active and self.monitor is None:
+            if self._warmup_error is not None:
+                # Load fail hua tha - dobara try (phir fail hua to error dobara dikhega)
+                self._retry_warm_up()
+                return
+            # Model abhi load ho raha hai - ready hote hi start ho jayega
+            self._start_requested = not self._start_requested
+            if self._start_requested:
+                self.status_label.config(text="Model Load Ho Raha Hai...", fg=self.text_secondary)
+            else:
+                self.status_label.config(text="Abhi Band Hai", fg=self.text_secondary)
+            return
+        
         if not self.is_active:
             # Monitoring shuru karo
             success = self.monitor.start()
             if success:
                 self.is_active = True
+                self.events.start()
                 # Button ka text aur color change karo
                 self.toggle_button.config(
                     text="Deactivate",
@@ -175,6 +324,7 @@ class FourEyesApp:
                     fg=self.active_green
                 )
                 print("✓ Monitoring activate ho gayi")
+                self.root.after(WARMUP_POLL_MS, self._poll_first_frame)
             else:
                 # Agar webcam nahi mila
                 messagebox.showerror(
@@ -184,6 +334,7 @@ class FourEyesApp:
         else:
             # Monitoring band karo
             self.monitor.stop()
+            self.events.stop()
             self.popup.hide_alert()  # Agar popup khula hai to band karo
             self.is_active = False
             # Button ko wapas original state me lao
@@ -200,11 +351,19 @@ class FourEyesApp:
             print("✗ Monitoring deactivate ho gayi")
     
     def _on_alert_event(self, event):
-        """Alert events handle karo - jab koi dekh raha ho"""
-        if event.get("alert"):
+        """
+        Alert events handle karo - jab koi dekh raha ho
+        Event bus isse Tk main thread pe call karta hai (Monitor thread se kabhi nahi)
+        """
+        if "error" in event:
+            # Monitor khud band ho chuka hai - UI ko bhi band state me lao
+            print(f"❌ ERROR: Monitoring ruk gayi - {event['error']}")
+            self._deactivate_monitoring()
+            messagebox.showerror("Error", f"Monitoring ruk gayi.\n\n{event['error']}")
+        elif event.get("alert"):
             # Popup dikhao - koi dekh raha hai!
             print("⚠ ALERT! Koi dekh raha hai - popup dikha rahe hain")
-            self.popup.show_alert()
+            self.popup.show_alert(triggered_at=event.get("triggered_at"))
         else:
             # Popup hide karo - ab koi nahi dekh raha
             print("✓ Safe hai - popup band kar rahe hain")
@@ -219,10 +378,12 @@ class FourEyesApp:
             self.monitor.stop()
         
         # Popup hide karo
+        self.events.stop()
         self.popup.hide_alert()
         
-        # Resources cleanup karo
-        self.monitor.cleanup()
+        # Resources cleanup karo - warm-up abhi chal raha ho to Monitor bana hi nahi
+        if self.monitor is not None:
+            self.monitor.cleanup()
         
         # Window destroy karo aur exit karo
         self.root.quit()
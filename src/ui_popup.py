@@ -1,27 +1,41 @@
 import tkinter as tk
 from tkinter import font
-import pyautogui
 import platform
+import time
+
+# Popup size
+POPUP_WIDTH = 700
+POPUP_HEIGHT = 320
 
 class AlertPopup:
     def __init__(self):
         self.popup_window = None
         self.is_visible = False
         self.deactivate_callback = None  # Callback to deactivate monitoring
+        self._screen_size = None         # Kis screen size pe center kiya tha
+        self._triggered_at = None        # Abhi wale alert ka threshold-cross time
+        
+        # Alert latency - gaze threshold cross se popup screen pe aane tak
+        self.shows = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._latency_total = 0.0
+        
+        # Widgets abhi bana lo (hidden) - alert ke time sirf dikhana hai
+        self._build()
     
     def register_deactivate_callback(self, callback):
         """Register callback to deactivate monitoring - chalega button ke liye"""
         self.deactivate_callback = callback
     
-    def show_alert(self):
-        """Alert popup dikhao - jab koi screen dekh raha ho"""
-        if self.is_visible:
-            return  # Agar pehle se dikha hua hai to dobara mat dikhao
-        
-        self.is_visible = True
-        
+    def _build(self):
+        """
+        Popup ek hi baar banao aur chhupa ke rakho - alert pe sirf deiconify
+        Har alert pe naye widgets banane ka delay nahi lagta
+        """
         # Popup window create karo
         self.popup_window = tk.Toplevel()
+        self.popup_window.withdraw()  # Abhi chhupa ke rakho
         self.popup_window.title("Alert!")
         
         # Window ko sabse upar rakho - kisi bhi window ke upar dikhe
@@ -30,18 +44,6 @@ class AlertPopup:
         # Window decorations hata do - cleaner look ke liye
         self.popup_window.overrideredirect(True)
         
-        # Window size set karo
-        window_width = 700
-        window_height = 320
-        
-        # Screen ke center me rakho
-        screen_width = self.popup_window.winfo_screenwidth()
-        screen_height = self.popup_window.winfo_screenheight()
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        
-        self.popup_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
-        
         # Modern color scheme - Warning orange/red gradient
         bg_gradient_top = "#ff6b6b"    # Light red
         bg_gradient_bottom = "#ee5a6f"  # Deeper red
@@ -127,9 +129,59 @@ class AlertPopup:
         # Escape key se bhi popup band ho sake
         self.popup_window.bind('<Escape>', lambda e: self._on_chalega_click())
         
+        # Popup screen pe aaya - alert latency yahi naapte hain
+        self.popup_window.bind('<Map>', self._on_map)
+    
+    def _center(self):
+        """Screen ke center me rakho - sirf jab screen size badla ho"""
+        screen_width = self.popup_window.winfo_screenwidth()
+        screen_height = self.popup_window.winfo_screenheight()
+        if (screen_width, screen_height) == self._screen_size:
+            return
+        self._screen_size = (screen_width, screen_height)
+        x = (screen_width - POPUP_WIDTH) // 2
+        y = (screen_height - POPUP_HEIGHT) // 2
+        self.popup_window.geometry(f"{POPUP_WIDTH}x{POPUP_HEIGHT}+{x}+{y}")
+    
+    def show_alert(self, triggered_at=None):
+        """
+        Alert popup dikhao - jab koi screen dekh raha ho
+        triggered_at = time.perf_counter() jab gaze threshold cross hua (latency ke liye)
+        """
+        if self.is_visible:
+            return  # Agar pehle se dikha hua hai to dobara mat dikhao
+        
+        self.is_visible = True
+        self._triggered_at = triggered_at if triggered_at is not None else time.perf_counter()
+        
+        self._center()
+        self.popup_window.deiconify()
+        self.popup_window.lift()
+        
         # Window ko focus do
         self.popup_window.focus_force()
     
+    def _on_map(self, event):
+        """Popup map hua - threshold cross se yaha tak ka time record karo"""
+        if event.widget is not self.popup_window or self._triggered_at is None:
+            return
+        latency = time.perf_counter() - self._triggered_at
+        self._triggered_at = None
+        self.shows += 1
+        self.last_latency = latency
+        self._latency_total += latency
+        self.max_latency = max(self.max_latency, latency)
+        print(f"⏱ Alert latency: {latency * 1000:.0f}ms")
+    
+    def get_stats(self):
+        """Kitni baar popup dikha aur threshold -> mapped latency (ms)"""
+        return {
+            "shows": self.shows,
+            "last_latency_ms": 1000.0 * self.last_latency,
+            "mean_latency_ms": 1000.0 * self._latency_total / self.shows if self.shows else 0.0,
+            "max_latency_ms": 1000.0 * self.max_latency,
+        }
+    
     def _on_chalega_click(self):
         """Chalega button click - popup band karo AUR monitoring bhi deactivate karo"""
         print("→ User ne 'Chalega' click kiya - monitoring DEACTIVATE ho rahi hai")
@@ -150,6 +202,9 @@ class AlertPopup:
         
         if system == "Windows":
             try:
+                # pyautogui import bhaari hai - sirf yaha zarurat padti hai
+                import pyautogui
+                
                 # Windows: Win+D se desktop dikha do
                 pyautogui.hotkey('win', 'd')
                 print("✓ Windows minimize ho gaye")
@@ -159,19 +214,19 @@ class AlertPopup:
             print(f"ℹ Minimize functionality sirf Windows ke liye available hai. Current OS: {system}")
     
     def hide_alert(self):
-        """Popup ko hide karo - jab zarurat na ho"""
+        """Popup ko hide karo - destroy nahi, agle alert pe wahi dikhega"""
         if not self.is_visible:
             return  # Agar pehle se hi band hai to kuch mat karo
         
         self.is_visible = False
+        self._triggered_at = None
         
         if self.popup_window:
             try:
-                self.popup_window.destroy()
+                self.popup_window.withdraw()
                 print("✓ Popup successfully band ho gayi")
             except Exception as e:
-                print(f"⚠ Popup destroy karne me issue: {e}")
-            self.popup_window = None
+                print(f"⚠ Popup hide karne me issue: {e}")
     
     def is_showing(self):
         """Check karo ki popup dikha hua hai ya nahi"""
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# src/ ke modules flat imports use karte hain (from monitor import Monitor)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))